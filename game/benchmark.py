@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Scenario benchmarks for the game subsystems
+
+Each scenario times its update and its render (onto an offscreen surface)
+separately for a number of frames and reports median/p95/p99 frame times.
+Results are saved as JSON so runs can be compared across commits.
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import json
+import math
+import platform
+import random
+import subprocess
+import time
+import numpy as np
+import pygame
+from typing import Dict, List, Optional
+from src.config import *
+from src.ai import AIScheduler
+from src.components import ComponentType
+from src.fleet import update_fleet
+from src.particles import ParticleSystem
+from src.projectile import ProjectilePool
+from src.ship import Ship
+from src.starfield import Starfield
+
+# 10x10 grid fully occupied: weapons in front, engines at the back,
+# a core in the middle and reactors and armor everywhere else
+BIG_SHIP_LAYOUT = [
+    (ComponentType.CORE if (x, y) == (4, 4) else
+     ComponentType.WEAPON_CANNON if y == 0 and x % 3 == 0 else
+     ComponentType.WEAPON_LASER if y == 0 else
+     ComponentType.ENGINE if y == 9 else
+     ComponentType.POWER if (x + y) % 3 == 0 else
+     ComponentType.ARMOR,
+     x, y)
+    for x in range(10) for y in range(10)
+]
+
+class Scenario:
+    """A scripted workload with separately timed update and render steps"""
+    
+    name = ""
+    
+    def setup(self):
+        """Create the scenario state"""
+    
+    def prepare(self):
+        """Untimed work before each frame (e.g. topping up entity counts)"""
+    
+    def update(self, dt: float):
+        """Advance the scenario by one frame"""
+    
+    def render(self, surface: pygame.Surface):
+        """Draw the scenario"""
+    
+    def count(self) -> int:
+        """Number of entities in the scenario"""
+        return 0
+
+class ParticleScenario(Scenario):
+    """About 10k live particles from large explosions"""
+    
+    name = "particles_10k"
+    TARGET = 10000
+    
+    def setup(self):
+        self.particles = ParticleSystem(rng=random.Random(1))
+        self.rng = random.Random(2)
+    
+    def prepare(self):
+        while len(self.particles) < self.TARGET:
+            self.particles.create_explosion(self.rng.uniform(0, SCREEN_WIDTH),
+                                            self.rng.uniform(0, SCREEN_HEIGHT), "large")
+    
+    def update(self, dt: float):
+        self.particles.update(dt)
+    
+    def render(self, surface: pygame.Surface):
+        self.particles.render(surface, 0, 0)
+    
+    def count(self) -> int:
+        return len(self.particles)
+
+class ProjectileScenario(Scenario):
+    """2k projectiles in flight across the screen"""
+    
+    name = "projectiles_2k"
+    TARGET = 2000
+    
+    def setup(self):
+        self.projectiles = ProjectilePool()
+        self.rng = random.Random(3)
+    
+    def prepare(self):
+        rng = self.rng
+        while len(self.projectiles) < self.TARGET:
+            self.projectiles.spawn(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT),
+                                   rng.uniform(0, math.pi * 2), rng.choice((350, 500)), 10,
+                                   rng.choice((0, 1)), 0)
+    
+    def update(self, dt: float):
+        self.projectiles.update(dt)
+    
+    def render(self, surface: pygame.Surface):
+        self.projectiles.render(surface, 0, 0)
+    
+    def count(self) -> int:
+        return len(self.projectiles)
+
+class FleetScenario(Scenario):
+    """200 AI ships chasing a target, with scheduled AI decisions"""
+    
+    name = "ships_200"
+    COUNT = 200
+    
+    def setup(self):
+        rng = random.Random(4)
+        self.target = Ship(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, 0, is_player=True)
+        self.ships = [Ship(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT), i + 1)
+                      for i in range(self.COUNT)]
+        for ship in self.ships:
+            ship.angle = rng.uniform(0, math.pi * 2)
+        self.ai = AIScheduler(random.Random(6))
+    
+    def update(self, dt: float):
+        self.ai.update(dt, self.ships, lambda ship: self.target, steer=False)
+        update_fleet([self.target] + self.ships, dt)
+    
+    def render(self, surface: pygame.Surface):
+        self.target.render(surface, 0, 0)
+        for ship in self.ships:
+            ship.render(surface, 0, 0)
+    
+    def count(self) -> int:
+        return len(self.ships) + 1
+
+class BigShipScenario(Scenario):
+    """One spinning 100-component ship"""
+    
+    name = "ship_100_components"
+    
+    def setup(self):
+        self.ship = Ship(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, 0, layout=BIG_SHIP_LAYOUT)
+        self.ship.angular_velocity = 1.0
+    
+    def update(self, dt: float):
+        self.ship.angular_velocity = 1.0  # Keep spinning despite drag
+        self.ship.update(dt)
+    
+    def render(self, surface: pygame.Surface):
+        self.ship.render(surface, 0, 0)
+    
+    def count(self) -> int:
+        return len(self.ship.components)
+
+class StarfieldScenario(Scenario):
+    """The starfield alone, with the camera panning diagonally"""
+    
+    name = "starfield"
+    SPEED = 300  # Camera pixels per second
+    
+    def setup(self):
+        self.starfield = Starfield(seed=5)
+        self.camera = 0.0
+        self.time = 0.0
+    
+    def update(self, dt: float):
+        self.camera += self.SPEED * dt
+        self.time += dt
+    
+    def render(self, surface: pygame.Surface):
+        self.starfield.render(surface, self.camera, self.camera * 0.5, self.time)
+
+SCENARIOS = [ParticleScenario, ProjectileScenario, FleetScenario, BigShipScenario, StarfieldScenario]
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Median/p95/p99/mean of frame times, in milliseconds"""
+    ms = np.array(samples) * 1000
+    return {
+        "median_ms": float(np.median(ms)),
+        "p95_ms": float(np.percentile(ms, 95)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "mean_ms": float(ms.mean()),
+    }
+
+def run_scenario(scenario: Scenario, frames: int, warmup: int) -> Dict:
+    """Run a scenario and collect update and render timings"""
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    scenario.setup()
+    update_times = []
+    render_times = []
+    
+    for frame in range(warmup + frames):
+        scenario.prepare()
+        
+        start = time.perf_counter()
+        scenario.update(SIM_DT)
+        updated = time.perf_counter()
+        scenario.render(surface)
+        rendered = time.perf_counter()
+        surface.fill(BLACK)
+        
+        if frame >= warmup:
+            update_times.append(updated - start)
+            render_times.append(rendered - updated)
+    
+    return {
+        "description": scenario.__doc__,
+        "count": scenario.count(),
+        "update": summarize(update_times),
+        "render": summarize(render_times),
+    }
+
+def git_commit() -> Optional[str]:
+    """Current commit hash, if run from a git checkout"""
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"],
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_comparison(results: Dict, baseline: Dict):
+    """Print median and p99 changes against a previous run"""
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'}:")
+    for name, result in results["scenarios"].items():
+        old = baseline.get("scenarios", {}).get(name)
+        if not old:
+            continue
+        for phase in ("update", "render"):
+            for stat in ("median_ms", "p99_ms"):
+                before = old[phase][stat]
+                after = result[phase][stat]
+                change = (after - before) / before * 100 if before else 0.0
+                print(f"  {name:22} {phase:6} {stat:9} {before:8.3f} -> {after:8.3f} ({change:+.1f}%)")
+
+def main():
+    """Run the selected scenarios and save the results"""
+    parser = argparse.ArgumentParser(description="Benchmark the game subsystems")
+    parser.add_argument("scenarios", nargs="*", help="scenario names (default: all)")
+    parser.add_argument("--frames", type=int, default=300, help="timed frames per scenario")
+    parser.add_argument("--warmup", type=int, default=30, help="untimed frames before timing")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file to write")
+    parser.add_argument("--compare", metavar="FILE", help="previous results to compare against")
+    args = parser.parse_args()
+    
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    selected = [cls for cls in SCENARIOS if not args.scenarios or cls.name in args.scenarios]
+    results = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "frames": args.frames,
+        "warmup": args.warmup,
+        "scenarios": {},
+    }
+    
+    print(f"{'scenario':22} {'count':>6}  {'update median/p95/p99 ms':>26}  {'render median/p95/p99 ms':>26}")
+    for cls in selected:
+        result = run_scenario(cls(), args.frames, args.warmup)
+        results["scenarios"][cls.name] = result
+        update, render = result["update"], result["render"]
+        print(f"{cls.name:22} {result['count']:6}  "
+              f"{update['median_ms']:8.3f} {update['p95_ms']:8.3f} {update['p99_ms']:8.3f}  "
+              f"{render['median_ms']:8.3f} {render['p95_ms']:8.3f} {render['p99_ms']:8.3f}")
+    
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nSaved to {args.output}")
+    
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(results, json.load(f))
+    
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
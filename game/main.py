@@ -2,20 +2,74 @@
 """
 Subspace - A Cosmoteer-inspired spaceship building and combat game
 """
+import argparse
 import pygame
 import sys
+from src.catalog import CatalogError, load_catalog, set_catalog
 from src.game import Game
+from src.replay import Replay
 
 def main():
     """Main entry point for the game"""
+    parser = argparse.ArgumentParser(description="Subspace")
+    parser.add_argument("--seed", type=int, help="seed for the battle (default: random)")
+    parser.add_argument("--record", metavar="FILE", help="record player inputs to a replay file")
+    parser.add_argument("--replay", metavar="FILE", help="play back a replay file")
+    parser.add_argument("--headless", action="store_true",
+                        help="with --replay: re-run the replay without a window and print the result")
+    parser.add_argument("--trace", metavar="FILE", help="write a Chrome trace of every frame to a file")
+    parser.add_argument("--blueprint", metavar="FILE",
+                        help="ship design file that F5/F9 save/load in build mode (default: player_ship.ssbp)")
+    parser.add_argument("--components", metavar="FILE",
+                        help="component catalog to use instead of src/data/components.json")
+    args = parser.parse_args()
+    
+    if args.components:
+        try:
+            set_catalog(load_catalog(args.components))
+        except CatalogError as e:
+            parser.error(str(e))
+    
+    replay = None
+    if args.replay:
+        try:
+            replay = Replay.load(args.replay)
+        except (OSError, ValueError) as e:
+            sys.exit(f"Could not load replay: {e}")
+    
+    if replay and args.headless:
+        # Re-run a recorded battle as fast as possible, e.g. for profiling
+        game = Game(headless=True)
+        if args.trace:
+            game.profiler.start_trace()
+        print(game.run_replay(replay))
+        if args.trace:
+            game.profiler.save_trace(args.trace)
+        return
+    
     pygame.init()
     
     # Create game instance
-    game = Game()
+    game = Game(seed=args.seed)
+    if replay:
+        game.play_replay(replay)
+    elif args.record:
+        game.start_recording(args.seed)
+    if args.trace:
+        game.trace_path = args.trace
+        game.profiler.start_trace()
+    if args.blueprint:
+        game.blueprint_path = args.blueprint
     
     # Run the game
     game.run()
     
+    if game.profiler.tracing:
+        game.profiler.save_trace(game.trace_path)
+    
+    if args.record and game.recording:
+        game.stop_recording().save(args.record)
+    
     pygame.quit()
     sys.exit()
 
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Run AI-vs-AI battles between ship designs in parallel and report the results
+"""
+import argparse
+import sys
+import time
+from src.battle_farm import (DEFAULT_DESIGNS, DEFAULT_TIME_LIMIT, load_designs, make_matchups,
+                             run_farm, summarize, undecided_matchups, write_csv, write_json)
+
+def main():
+    """Parse arguments, run the farm and write the reports"""
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--designs", help="JSON file of named layouts (default: built-in ships)")
+    parser.add_argument("--seeds", type=int, default=50, help="battles per matchup")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--time-limit", type=float, default=DEFAULT_TIME_LIMIT,
+                        help="simulated seconds before a battle is decided on remaining hull")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--csv", help="write matchup summaries to this CSV file")
+    parser.add_argument("--json", help="write the full report to this JSON file")
+    parser.add_argument("--check", action="store_true",
+                        help="exit with an error if any matchup only produced draws")
+    args = parser.parse_args()
+    
+    designs = load_designs(args.designs) if args.designs else DEFAULT_DESIGNS
+    matchups = make_matchups(designs, range(args.first_seed, args.first_seed + args.seeds))
+    
+    start = time.perf_counter()
+    results = run_farm(matchups, args.time_limit, args.workers)
+    elapsed = time.perf_counter() - start
+    
+    summaries = summarize(results)
+    for s in summaries:
+        ttk = f"{s.mean_time_to_kill:.1f}s" if s.mean_time_to_kill is not None else "-"
+        print(f"{s.name_a} vs {s.name_b}: {s.wins_a}-{s.wins_b}-{s.draws} "
+              f"(win rate {s.win_rate_a:.0%}, {s.kills} by kill), time to kill {ttk}, "
+              f"hull left {s.mean_hull_a:.0%}/{s.mean_hull_b:.0%}, "
+              f"damage {s.mean_damage_a:.0f}/{s.mean_damage_b:.0f}")
+    print(f"{len(results)} battles in {elapsed:.1f}s")
+    
+    undecided = undecided_matchups(summaries)
+    for s in undecided:
+        print(f"Warning: every {s.name_a} vs {s.name_b} battle was a draw", file=sys.stderr)
+    
+    if args.csv:
+        write_csv(args.csv, summaries)
+    if args.json:
+        write_json(args.json, results)
+    if args.check and undecided:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
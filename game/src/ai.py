@@ -0,0 +1,91 @@
+"""Scheduling of AI decisions for computer-controlled ships"""
+import random
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+from .config import AI_DECISION_HZ, AI_FIRE_CHANCE, AI_MAX_DECISIONS_PER_STEP, REFERENCE_DT, SIM_HZ
+from .ship import Ship
+
+class AIScheduler:
+    """Runs AI decisions at a fixed rate per ship, spread evenly over steps.
+    
+    Ships wait in a round-robin queue. Each step the front of the queue
+    decides (target heading, thrust, whether to fire), enough ships that
+    every one decides about decision_hz times a second, but never more than
+    max_decisions. Between decisions ships only steer towards their last
+    heading, so the per-step cost stays flat as fleets grow. The budget is
+    counted in decisions rather than wall time, so battles stay
+    reproducible.
+    """
+    
+    def __init__(self, rng: random.Random, decision_hz: float = AI_DECISION_HZ,
+                 max_decisions: int = AI_MAX_DECISIONS_PER_STEP):
+        self.rng = rng
+        self.interval = max(1, round(SIM_HZ / decision_hz))  # Steps between a ship's decisions
+        self.max_decisions = max_decisions
+        self._queue: Deque[Ship] = deque()
+        self.decisions = 0  # Made during the last update
+        self._pending = 0.0  # Fraction of a decision carried over to the next step
+        
+        # Scheduled ships and the time of their last decision (or of joining)
+        self.time = 0.0
+        self._last_decision: Dict[Ship, float] = {}
+    
+    def fire_chance(self, elapsed: float) -> float:
+        """Chance to fire at a decision elapsed seconds after the ship's last one"""
+        return 1 - (1 - AI_FIRE_CHANCE) ** (elapsed / REFERENCE_DT)
+    
+    def clear(self):
+        """Forget all ships, e.g. when a new battle starts"""
+        self._queue.clear()
+        self._last_decision.clear()
+        self._pending = 0.0
+        self.time = 0.0
+    
+    def update(self, dt: float, ships: List[Ship],
+               choose_target: Callable[[Ship], Optional[Ship]], steer: bool = True) -> List[Ship]:
+        """Make this step's due decisions and steer every ship.
+        
+        Pass steer=False when the ships are steered in a batch by
+        fleet.update_fleet instead. Returns the ships that decided to fire
+        this step.
+        """
+        # New ships go to the front so they act quickly; departed ones are
+        # dropped when they reach the front
+        self.time += dt
+        queue = self._queue
+        last_decision = self._last_decision
+        active = set(ships)
+        for ship in ships:
+            if ship not in last_decision:
+                last_decision[ship] = self.time
+                queue.appendleft(ship)
+        
+        firing = []
+        # Each ship's share is 1/interval of a decision per step; the fraction
+        # left over carries to the next step, and work over the cap is dropped
+        self._pending += len(active) / self.interval
+        decisions = min(self.max_decisions, int(self._pending))
+        self._pending = min(self._pending - decisions, 1.0)
+        self.decisions = 0
+        while self.decisions < decisions and queue:
+            ship = queue.popleft()
+            if ship not in active:
+                del last_decision[ship]
+                continue
+            queue.append(ship)
+            self.decisions += 1
+            
+            # Chance to fire covers the time since this ship last decided, so
+            # the firing rate per second holds even when the cap delays ships
+            elapsed = self.time - last_decision[ship]
+            last_decision[ship] = self.time
+            
+            target = choose_target(ship)
+            ship.ai_decide(target)
+            if target is not None and self.rng.random() < self.fire_chance(elapsed):
+                firing.append(ship)
+        
+        if steer:
+            for ship in ships:
+                ship.ai_steer(dt)
+        return firing
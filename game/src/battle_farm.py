@@ -0,0 +1,212 @@
+"""Parallel headless AI-vs-AI battles for balancing ship designs"""
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
+from itertools import permutations
+from typing import Dict, Iterable, List, Optional
+from .blueprint import Blueprint
+from .game import Game
+from .ship import Layout, Ship, PLAYER_LAYOUT, ENEMY_LAYOUT
+
+# Battles with no kill after this many simulated seconds go to the ship
+# with more of its hull left, and are draws only if that is level too
+DEFAULT_TIME_LIMIT = 120.0
+
+# How a battle was decided
+DECIDED_KILL = "kill"
+DECIDED_HULL = "hull"
+DECIDED_DRAW = "draw"
+
+DEFAULT_DESIGNS: Dict[str, Layout] = {
+    "player": PLAYER_LAYOUT,
+    "enemy": ENEMY_LAYOUT,
+}
+
+@dataclass
+class Matchup:
+    """One seeded duel between two named ship designs"""
+    name_a: str
+    layout_a: Layout
+    name_b: str
+    layout_b: Layout
+    seed: int
+
+@dataclass
+class BattleResult:
+    """Outcome of one duel"""
+    name_a: str
+    name_b: str
+    seed: int
+    winner: Optional[str]  # None for a draw
+    decided_by: str  # DECIDED_KILL, DECIDED_HULL (on the time limit) or DECIDED_DRAW
+    time: float  # Simulated seconds until the battle was decided or timed out
+    hull_a: float  # Fraction of design A's starting health left
+    hull_b: float
+    damage_a: int  # Dealt by design A
+    damage_b: int  # Dealt by design B
+    shots_fired: int
+
+@dataclass
+class MatchupSummary:
+    """Aggregated results of every seed of one matchup"""
+    name_a: str
+    name_b: str
+    battles: int
+    wins_a: int
+    wins_b: int
+    draws: int
+    kills: int  # Battles ended by a kill rather than on hull
+    win_rate_a: float
+    win_rate_b: float
+    mean_time_to_kill: Optional[float]  # Over battles ended by a kill only
+    mean_hull_a: float
+    mean_hull_b: float
+    mean_damage_a: float
+    mean_damage_b: float
+
+def load_designs(path: str) -> Dict[str, Layout]:
+    """Load named layouts from JSON: {"name": [["core", 4, 4], ...], ...}"""
+    with open(path) as f:
+        data = json.load(f)
+    
+    designs = {}
+    for name, entries in data.items():
+        blueprint = Blueprint.from_json({"name": name, "components": entries})
+        designs[name] = blueprint.layout
+    return designs
+
+def make_matchups(designs: Dict[str, Layout], seeds: Iterable[int]) -> List[Matchup]:
+    """Pair every design against every other, in both starting positions, for each seed"""
+    seeds = list(seeds)
+    return [
+        Matchup(name_a, designs[name_a], name_b, designs[name_b], seed)
+        for name_a, name_b in permutations(designs, 2)
+        for seed in seeds
+    ]
+
+def run_battle(matchup: Matchup, time_limit: float = DEFAULT_TIME_LIMIT) -> BattleResult:
+    """Fight one duel to the death (or the time limit) without rendering.
+    
+    Design A flies the player ship and design B the single enemy; both are
+    AI-controlled, and the same seed always gives the same battle. A duel
+    without a kill is won by the ship with the larger fraction of its
+    starting health left.
+    """
+    game = Game(headless=True, particles=False)
+    game.player_layout = matchup.layout_a
+    game.enemy_layouts = [matchup.layout_b]
+    game.spawn_waves = False
+    result = game.simulate(time_limit, matchup.seed)
+    
+    a_destroyed = result.player_destroyed
+    b_destroyed = all(enemy.is_destroyed() for enemy in game.enemies)
+    hull_a = _hull_left(game, [game.player], matchup.layout_a)
+    hull_b = _hull_left(game, game.enemies, matchup.layout_b)
+    if a_destroyed != b_destroyed:
+        winner = matchup.name_b if a_destroyed else matchup.name_a
+        decided_by = DECIDED_KILL
+    elif hull_a != hull_b:
+        winner = matchup.name_a if hull_a > hull_b else matchup.name_b
+        decided_by = DECIDED_HULL
+    else:
+        winner = None
+        decided_by = DECIDED_DRAW
+    
+    return BattleResult(
+        name_a=matchup.name_a,
+        name_b=matchup.name_b,
+        seed=matchup.seed,
+        winner=winner,
+        decided_by=decided_by,
+        time=result.sim_time,
+        hull_a=hull_a,
+        hull_b=hull_b,
+        damage_a=result.damage_dealt,
+        damage_b=result.damage_taken,
+        shots_fired=result.shots_fired,
+    )
+
+def _hull_left(game: Game, ships: List[Ship], layout: Layout) -> float:
+    """Fraction of a design's starting health its surviving ships still have"""
+    start = game.blueprints.prototype(layout).total_health
+    left = sum(ship.total_health for ship in ships if not ship.is_destroyed())
+    return round(left / start, 4) if start else 0.0
+
+def run_farm(matchups: List[Matchup], time_limit: float = DEFAULT_TIME_LIMIT,
+             workers: Optional[int] = None) -> List[BattleResult]:
+    """Run matchups across a process pool (all cores by default).
+    
+    Results come back in matchup order, so a farm run is as deterministic
+    as its seeds regardless of the number of workers.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(matchups) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(partial(run_battle, time_limit=time_limit),
+                                 matchups, chunksize=chunksize))
+
+def summarize(results: List[BattleResult]) -> List[MatchupSummary]:
+    """Aggregate battle results per (design A, design B) matchup"""
+    groups: Dict[tuple, List[BattleResult]] = {}
+    for result in results:
+        groups.setdefault((result.name_a, result.name_b), []).append(result)
+    
+    summaries = []
+    for (name_a, name_b), battles in groups.items():
+        count = len(battles)
+        wins_a = sum(1 for b in battles if b.winner == name_a)
+        wins_b = sum(1 for b in battles if b.winner == name_b)
+        kills = [b.time for b in battles if b.decided_by == DECIDED_KILL]
+        summaries.append(MatchupSummary(
+            name_a=name_a,
+            name_b=name_b,
+            battles=count,
+            wins_a=wins_a,
+            wins_b=wins_b,
+            draws=count - wins_a - wins_b,
+            kills=len(kills),
+            win_rate_a=wins_a / count,
+            win_rate_b=wins_b / count,
+            mean_time_to_kill=sum(kills) / len(kills) if kills else None,
+            mean_hull_a=sum(b.hull_a for b in battles) / count,
+            mean_hull_b=sum(b.hull_b for b in battles) / count,
+            mean_damage_a=sum(b.damage_a for b in battles) / count,
+            mean_damage_b=sum(b.damage_b for b in battles) / count,
+        ))
+    return summaries
+
+def undecided_matchups(summaries: List[MatchupSummary]) -> List[MatchupSummary]:
+    """Matchups where every battle was a draw, so they say nothing about balance"""
+    return [s for s in summaries if s.draws == s.battles]
+
+def design_win_rates(results: List[BattleResult]) -> Dict[str, float]:
+    """Fraction of its battles each design won, over every opponent and position"""
+    battles: Dict[str, int] = {}
+    wins: Dict[str, int] = {}
+    for result in results:
+        for name in (result.name_a, result.name_b):
+            battles[name] = battles.get(name, 0) + 1
+        if result.winner is not None:
+            wins[result.winner] = wins.get(result.winner, 0) + 1
+    return {name: wins.get(name, 0) / count for name, count in battles.items()}
+
+def write_csv(path: str, summaries: List[MatchupSummary]):
+    """Write one row per matchup summary"""
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(MatchupSummary.__dataclass_fields__))
+        writer.writeheader()
+        for summary in summaries:
+            writer.writerow(asdict(summary))
+
+def write_json(path: str, results: List[BattleResult]):
+    """Write per-design win rates, matchup summaries and every battle"""
+    report = {
+        "designs": design_win_rates(results),
+        "matchups": [asdict(summary) for summary in summarize(results)],
+        "battles": [asdict(result) for result in results],
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
@@ -0,0 +1,158 @@
+"""Ship blueprints: saved component layouts and fast spawning from them"""
+import json
+import struct
+from typing import Dict, List, Optional, Tuple, Union
+from .catalog import ComponentCatalog, get_catalog
+from .components import ComponentType
+from .ship import Layout, Ship
+
+class Blueprint:
+    """A named ship design, saved as compact binary or as readable JSON.
+    
+    The binary format stores each component type name once in a table and
+    every component as three bytes (table index, grid x, grid y), so files
+    stay valid when the component catalog is reordered or extended.
+    """
+    
+    MAGIC = b"SSBP"
+    VERSION = 1
+    HEADER = struct.Struct("<4sBBH")  # magic, version, type table size, component count
+    COMPONENT = struct.Struct("<BBB")  # type table index, grid_x, grid_y
+    
+    # Grid coordinates must fit the binary format
+    MAX_GRID = 255
+    
+    def __init__(self, layout: Layout, name: str = ""):
+        self.name = name
+        self.layout: Layout = [(component_type, int(grid_x), int(grid_y))
+                               for component_type, grid_x, grid_y in layout]
+    
+    @classmethod
+    def from_ship(cls, ship: Ship, name: str = "") -> "Blueprint":
+        """Capture a ship's current components"""
+        return cls(ship.get_layout(), name)
+    
+    def validate(self, catalog: Optional[ComponentCatalog] = None):
+        """Check component types, positions and the core; raises ValueError"""
+        catalog = catalog or get_catalog()
+        cells = set()
+        for component_type, grid_x, grid_y in self.layout:
+            if component_type not in catalog.ids:
+                raise ValueError(f"Blueprint {self.name!r}: unknown component type {component_type!r}")
+            if not (0 <= grid_x <= self.MAX_GRID and 0 <= grid_y <= self.MAX_GRID):
+                raise ValueError(f"Blueprint {self.name!r}: cell ({grid_x}, {grid_y}) is outside the grid")
+            if (grid_x, grid_y) in cells:
+                raise ValueError(f"Blueprint {self.name!r}: two components in cell ({grid_x}, {grid_y})")
+            cells.add((grid_x, grid_y))
+        if not any(component_type == ComponentType.CORE for component_type, _, _ in self.layout):
+            raise ValueError(f"Blueprint {self.name!r} has no core")
+    
+    def to_json(self) -> Dict:
+        """Get the blueprint as JSON data: {"name": ..., "components": [[type, x, y], ...]}"""
+        return {"name": self.name, "components": [list(entry) for entry in self.layout]}
+    
+    @classmethod
+    def from_json(cls, data: Dict) -> "Blueprint":
+        """Create a blueprint from JSON data written by to_json"""
+        try:
+            blueprint = cls([(str(t), x, y) for t, x, y in data["components"]], str(data.get("name", "")))
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Malformed blueprint data: {e}") from e
+        blueprint.validate()
+        return blueprint
+    
+    def to_bytes(self) -> bytes:
+        """Encode the blueprint in the binary format"""
+        self.validate()
+        types: List[str] = list(dict.fromkeys(component_type for component_type, _, _ in self.layout))
+        index = {component_type: i for i, component_type in enumerate(types)}
+        
+        parts = [self.HEADER.pack(self.MAGIC, self.VERSION, len(types), len(self.layout))]
+        for name in [self.name] + types:
+            encoded = name.encode("utf-8")[:255]
+            parts.append(bytes((len(encoded),)) + encoded)
+        for component_type, grid_x, grid_y in self.layout:
+            parts.append(self.COMPONENT.pack(index[component_type], grid_x, grid_y))
+        return b"".join(parts)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Blueprint":
+        """Decode a blueprint written by to_bytes"""
+        try:
+            magic, version, num_types, num_components = cls.HEADER.unpack_from(data)
+            if magic != cls.MAGIC or version != cls.VERSION:
+                raise ValueError(f"not a version {cls.VERSION} blueprint")
+            
+            offset = cls.HEADER.size
+            strings = []
+            for _ in range(num_types + 1):
+                length = data[offset]
+                strings.append(data[offset + 1:offset + 1 + length].decode("utf-8"))
+                offset += 1 + length
+            name, types = strings[0], strings[1:]
+            
+            layout = []
+            for _ in range(num_components):
+                type_index, grid_x, grid_y = cls.COMPONENT.unpack_from(data, offset)
+                layout.append((types[type_index], grid_x, grid_y))
+                offset += cls.COMPONENT.size
+        except (struct.error, IndexError, UnicodeDecodeError) as e:
+            raise ValueError(f"Corrupt blueprint data: {e}") from e
+        
+        blueprint = cls(layout, name)
+        blueprint.validate()
+        return blueprint
+    
+    def save(self, path: str):
+        """Write the blueprint, as JSON if the path ends in .json and binary otherwise"""
+        if path.lower().endswith(".json"):
+            self.validate()
+            with open(path, "w") as f:
+                json.dump(self.to_json(), f, indent=2)
+        else:
+            with open(path, "wb") as f:
+                f.write(self.to_bytes())
+    
+    @classmethod
+    def load(cls, path: str) -> "Blueprint":
+        """Read a blueprint written by save"""
+        with open(path, "rb") as f:
+            data = f.read()
+        try:
+            if data.startswith(cls.MAGIC):
+                return cls.from_bytes(data)
+            return cls.from_json(json.loads(data))
+        except ValueError as e:
+            raise ValueError(f"{path}: {e}") from e
+
+class BlueprintCache:
+    """Prototype ships by layout, so spawning clones one instead of building a ship.
+    
+    A prototype is built (and, with sprites enabled, rendered) once per
+    layout and catalog. Spawned ships copy its components and stats and
+    share its sprite.
+    """
+    
+    def __init__(self, sprites: bool = True):
+        self.sprites = sprites
+        self._prototypes: Dict[Tuple[ComponentCatalog, Tuple], Ship] = {}
+    
+    def prototype(self, design: Union[Blueprint, Layout]) -> Ship:
+        """Get the prototype ship of a blueprint or layout"""
+        layout = design.layout if isinstance(design, Blueprint) else design
+        key = (get_catalog(), tuple(map(tuple, layout)))
+        ship = self._prototypes.get(key)
+        if ship is None:
+            ship = self._prototypes[key] = Ship(0, 0, -1, layout=layout)
+            if self.sprites:
+                ship.build_sprite()
+        return ship
+    
+    def spawn(self, design: Union[Blueprint, Layout], x: float, y: float, ship_id: int,
+              is_player: bool = False) -> Ship:
+        """Create a ship from a blueprint or layout at a position"""
+        return self.prototype(design).clone(x, y, ship_id, is_player)
+    
+    def clear(self):
+        """Drop all prototypes"""
+        self._prototypes.clear()
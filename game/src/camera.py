@@ -0,0 +1,41 @@
+"""Camera view rectangle and visibility culling"""
+import pygame
+import numpy as np
+from typing import Dict, Tuple
+
+def points_in_view(x: np.ndarray, y: np.ndarray, width: int, height: int, margin: int) -> np.ndarray:
+    """Which screen-space points lie within margin pixels of a width x height screen"""
+    return (x >= -margin) & (x <= width + margin) & (y >= -margin) & (y <= height + margin)
+
+class Camera:
+    """The screen's view into the world, for skipping off-screen entities before drawing"""
+    
+    # Extra world pixels kept around the view, covering interpolation and
+    # anything drawn slightly outside an entity's bounds
+    CULL_MARGIN = 8
+    
+    def __init__(self, width: int, height: int):
+        self.x = 0.0  # World position of the screen's top-left corner
+        self.y = 0.0
+        self.width = width
+        self.height = height
+        self._view = pygame.Rect(0, 0, width, height)
+        
+        # (drawn, culled) per entity kind for the current frame
+        self.counts: Dict[str, Tuple[int, int]] = {}
+    
+    def move_to(self, x: float, y: float):
+        """Place the screen's top-left corner at a world position"""
+        self.x = x
+        self.y = y
+        margin = self.CULL_MARGIN
+        self._view.update(int(x) - margin, int(y) - margin,
+                          self.width + 2 * margin + 1, self.height + 2 * margin + 1)
+    
+    def is_visible(self, bounds: pygame.Rect) -> bool:
+        """Whether world-space bounds overlap the view"""
+        return self._view.colliderect(bounds)
+    
+    def record(self, kind: str, drawn: int, culled: int):
+        """Store this frame's drawn and culled counts for an entity kind"""
+        self.counts[kind] = (drawn, culled)
@@ -0,0 +1,188 @@
+"""Component catalog: part types and stats loaded from a data file"""
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from .projectile import PROJECTILE_TYPES
+
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(__file__), "data", "components.json")
+
+# Type indicators a component can draw on its tile
+ICONS = ("core", "engine", "weapon")
+
+class CatalogError(ValueError):
+    """A component catalog file is malformed"""
+
+@dataclass(frozen=True)
+class ComponentStats:
+    """Immutable stats shared by every component of one type"""
+    type_id: int
+    type: str
+    name: str
+    max_health: int
+    power_consumption: int = 0
+    power_generation: int = 0
+    thrust: float = 0
+    color: Tuple[int, int, int] = (100, 100, 100)
+    icon: Optional[str] = None  # One of ICONS
+    hotkey: Optional[int] = None  # Builder key 1-9; parts without one can't be placed
+    
+    # Weapon properties (projectile_id is -1 for non-weapons)
+    projectile_id: int = -1
+    damage: int = 0
+    speed: float = 0
+    fire_cooldown: float = 0
+    
+    @property
+    def is_weapon(self) -> bool:
+        """Whether components of this type fire projectiles"""
+        return self.projectile_id >= 0
+
+class ComponentCatalog:
+    """Component types compiled into tables indexed by integer type id.
+    
+    Type ids follow the order of the catalog file, and replays store them,
+    so new parts should be appended rather than inserted.
+    """
+    
+    def __init__(self, stats: List[ComponentStats]):
+        self.stats: Tuple[ComponentStats, ...] = tuple(stats)
+        self.types: Tuple[str, ...] = tuple(s.type for s in stats)
+        self.ids: Dict[str, int] = {s.type: s.type_id for s in stats}
+        
+        # Builder palette in catalog order, and hotkey -> type
+        self.buildable: Tuple[str, ...] = tuple(s.type for s in stats if s.hotkey is not None)
+        self.hotkeys: Dict[int, str] = {s.hotkey: s.type for s in stats if s.hotkey is not None}
+        
+        # Fingerprint of every part's stats, so replays can tell they are
+        # played back with the catalog they were recorded with
+        self.digest: bytes = hashlib.sha256(repr(self.stats).encode("utf-8")).digest()[:8]
+    
+    def __len__(self) -> int:
+        return len(self.stats)
+    
+    def type_id(self, component_type: str) -> int:
+        """Get the id of a component type"""
+        type_id = self.ids.get(component_type)
+        if type_id is None:
+            raise CatalogError(f"Unknown component type {component_type!r}")
+        return type_id
+    
+    def get(self, component_type: str) -> ComponentStats:
+        """Get the stats of a component type"""
+        return self.stats[self.type_id(component_type)]
+
+def _field(entry: dict, key: str, kind, where: str, default=None, minimum: Optional[float] = 0):
+    """Read and check one numeric field of a catalog entry"""
+    value = entry.get(key, default)
+    if value is None:
+        raise CatalogError(f"{where}: missing {key!r}")
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or (kind is int and not isinstance(value, int)):
+        raise CatalogError(f"{where}: {key!r} must be {'an integer' if kind is int else 'a number'}")
+    if minimum is not None and value < minimum:
+        raise CatalogError(f"{where}: {key!r} must be at least {minimum}")
+    return kind(value)
+
+def parse_catalog(data, source: str = "catalog") -> ComponentCatalog:
+    """Validate catalog data (a list of part entries) and compile it"""
+    if not isinstance(data, list) or not data:
+        raise CatalogError(f"{source}: expected a non-empty list of components")
+    
+    stats = []
+    seen_hotkeys = set()
+    for type_id, entry in enumerate(data):
+        where = f"{source}[{type_id}]"
+        if not isinstance(entry, dict):
+            raise CatalogError(f"{where}: expected an object")
+        component_type = entry.get("type")
+        if not isinstance(component_type, str) or not component_type:
+            raise CatalogError(f"{where}: missing 'type'")
+        where = f"{source}: {component_type!r}"
+        if any(s.type == component_type for s in stats):
+            raise CatalogError(f"{where}: duplicate type")
+        
+        color = entry.get("color", (100, 100, 100))
+        if (not isinstance(color, (list, tuple)) or len(color) != 3 or
+                not all(isinstance(c, int) and 0 <= c <= 255 for c in color)):
+            raise CatalogError(f"{where}: 'color' must be three integers 0-255")
+        
+        icon = entry.get("icon")
+        if icon is not None and icon not in ICONS:
+            raise CatalogError(f"{where}: unknown icon {icon!r} (expected one of {', '.join(ICONS)})")
+        
+        hotkey = entry.get("hotkey")
+        if hotkey is not None:
+            if isinstance(hotkey, bool) or not isinstance(hotkey, int) or not 1 <= hotkey <= 9:
+                raise CatalogError(f"{where}: 'hotkey' must be an integer 1-9")
+            if hotkey in seen_hotkeys:
+                raise CatalogError(f"{where}: hotkey {hotkey} is already used")
+            seen_hotkeys.add(hotkey)
+        
+        weapon = {}
+        projectile_id = -1
+        if "weapon" in entry:
+            weapon = entry["weapon"]
+            if not isinstance(weapon, dict):
+                raise CatalogError(f"{where}: 'weapon' must be an object")
+            if weapon.get("projectile") not in PROJECTILE_TYPES:
+                raise CatalogError(f"{where}: weapon projectile must be one of {', '.join(PROJECTILE_TYPES)}")
+            projectile_id = PROJECTILE_TYPES.index(weapon["projectile"])
+        
+        stats.append(ComponentStats(
+            type_id=type_id,
+            type=component_type,
+            name=str(entry.get("name", component_type)),
+            max_health=_field(entry, "max_health", int, where, minimum=1),
+            power_consumption=_field(entry, "power_consumption", int, where, 0),
+            power_generation=_field(entry, "power_generation", int, where, 0),
+            thrust=_field(entry, "thrust", float, where, 0),
+            color=tuple(color),
+            icon=icon,
+            hotkey=hotkey,
+            projectile_id=projectile_id,
+            damage=_field(weapon, "damage", int, where) if weapon else 0,
+            speed=_field(weapon, "speed", float, where, minimum=1) if weapon else 0,
+            fire_cooldown=_field(weapon, "cooldown", float, where, minimum=0.01) if weapon else 0,
+        ))
+    
+    catalog = ComponentCatalog(stats)
+    if "core" not in catalog.ids:
+        raise CatalogError(f"{source}: the 'core' component type is required")
+    if not catalog.buildable:
+        raise CatalogError(f"{source}: at least one component needs a builder 'hotkey'")
+    return catalog
+
+# Compiled catalogs by (path, modification time)
+_cache: Dict[Tuple[str, int], ComponentCatalog] = {}
+
+def load_catalog(path: str = DEFAULT_CATALOG_PATH) -> ComponentCatalog:
+    """Load, validate and compile a catalog file, reusing it until the file changes"""
+    path = os.path.abspath(path)
+    try:
+        key = (path, os.stat(path).st_mtime_ns)
+    except OSError as e:
+        raise CatalogError(f"Cannot read component catalog {path}: {e}") from e
+    catalog = _cache.get(key)
+    if catalog is None:
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise CatalogError(f"{path}: {e}") from e
+        catalog = _cache[key] = parse_catalog(data, os.path.basename(path))
+    return catalog
+
+_active: Optional[ComponentCatalog] = None
+
+def get_catalog() -> ComponentCatalog:
+    """Get the catalog new components are created from (the default one unless replaced)"""
+    global _active
+    if _active is None:
+        _active = load_catalog()
+    return _active
+
+def set_catalog(catalog: ComponentCatalog):
+    """Create components from another catalog, e.g. a modded one"""
+    global _active
+    _active = catalog
@@ -1,22 +1,10 @@
 """Ship component definitions"""
 import pygame
 import math
-from dataclasses import dataclass
-from typing import Optional, Tuple
+from .catalog import ComponentStats, get_catalog
 
-@dataclass
-class ComponentStats:
-    """Stats for a ship component"""
-    name: str
-    health: int
-    max_health: int
-    power_consumption: int
-    power_generation: int = 0
-    thrust: float = 0
-    color: Tuple[int, int, int] = (100, 100, 100)
-    
 class ComponentType:
-    """Component type definitions"""
+    """Built-in component types the code refers to; the catalog defines all of them"""
     CORE = "core"
     ENGINE = "engine"
     WEAPON_LASER = "weapon_laser"
@@ -26,112 +14,70 @@ class ComponentType:
     SHIELD = "shield"
 
 class Component:
-    """Base class for ship components"""
+    """A component on a ship's grid.
+    
+    Type-wide stats live in a shared ComponentStats record from the
+    component catalog; instances only hold their own position and mutable
+    state.
+    """
+    __slots__ = ("component_type", "type_id", "grid_x", "grid_y", "stats", "health", "cooldown", "rotation")
+    
+    # Number of distinct damage shades used when rendering
+    DAMAGE_BUCKETS = 8
     
     def __init__(self, component_type: str, grid_x: int, grid_y: int):
+        catalog = get_catalog()
         self.component_type = component_type
+        self.type_id = catalog.type_id(component_type)
         self.grid_x = grid_x
         self.grid_y = grid_y
-        self.stats = self._get_stats()
+        self.stats: ComponentStats = catalog.stats[self.type_id]
+        self.health = self.stats.max_health
         self.cooldown = 0
         self.rotation = 0  # Component rotation relative to ship
-        
-    def _get_stats(self) -> ComponentStats:
-        """Get stats based on component type"""
-        stats_map = {
-            ComponentType.CORE: ComponentStats(
-                name="Core",
-                health=200,
-                max_health=200,
-                power_consumption=0,
-                power_generation=50,
-                color=(255, 200, 0)
-            ),
-            ComponentType.ENGINE: ComponentStats(
-                name="Engine",
-                health=50,
-                max_health=50,
-                power_consumption=10,
-                thrust=200.0,
-                color=(0, 150, 255)
-            ),
-            ComponentType.WEAPON_LASER: ComponentStats(
-                name="Laser",
-                health=40,
-                max_health=40,
-                power_consumption=15,
-                color=(255, 0, 0)
-            ),
-            ComponentType.WEAPON_CANNON: ComponentStats(
-                name="Cannon",
-                health=60,
-                max_health=60,
-                power_consumption=20,
-                color=(150, 150, 0)
-            ),
-            ComponentType.ARMOR: ComponentStats(
-                name="Armor",
-                health=150,
-                max_health=150,
-                power_consumption=0,
-                color=(150, 150, 150)
-            ),
-            ComponentType.POWER: ComponentStats(
-                name="Reactor",
-                health=80,
-                max_health=80,
-                power_consumption=0,
-                power_generation=100,
-                color=(0, 255, 100)
-            ),
-            ComponentType.SHIELD: ComponentStats(
-                name="Shield",
-                health=30,
-                max_health=30,
-                power_consumption=25,
-                color=(100, 200, 255)
-            ),
-        }
-        return stats_map.get(self.component_type, ComponentStats(
-            name="Unknown",
-            health=50,
-            max_health=50,
-            power_consumption=0
-        ))
+    
+    def copy(self) -> "Component":
+        """Create an independent component with the same type, position and state"""
+        copy = Component.__new__(Component)
+        copy.component_type = self.component_type
+        copy.type_id = self.type_id
+        copy.grid_x = self.grid_x
+        copy.grid_y = self.grid_y
+        copy.stats = self.stats
+        copy.health = self.health
+        copy.cooldown = self.cooldown
+        copy.rotation = self.rotation
+        return copy
     
     def take_damage(self, damage: int) -> bool:
         """Apply damage to component. Returns True if destroyed."""
-        self.stats.health -= damage
-        if self.stats.health <= 0:
-            self.stats.health = 0
+        self.health -= damage
+        if self.health <= 0:
+            self.health = 0
             return True
         return False
     
-    def update(self, dt: float):
-        """Update component state"""
-        if self.cooldown > 0:
-            self.cooldown -= dt
+    def damage_bucket(self) -> int:
+        """Quantized health level (0..DAMAGE_BUCKETS) that drives the damage shade"""
+        return math.ceil(self.health * self.DAMAGE_BUCKETS / self.stats.max_health)
     
     def can_fire(self) -> bool:
         """Check if weapon component can fire"""
-        return (self.component_type in [ComponentType.WEAPON_LASER, ComponentType.WEAPON_CANNON] 
+        return (self.stats.is_weapon
                 and self.cooldown <= 0 
-                and self.stats.health > 0)
+                and self.health > 0)
     
     def fire(self):
         """Fire weapon (set cooldown)"""
-        if self.component_type == ComponentType.WEAPON_LASER:
-            self.cooldown = 0.5  # 2 shots per second
-        elif self.component_type == ComponentType.WEAPON_CANNON:
-            self.cooldown = 1.5  # Slower but more powerful
+        self.cooldown = self.stats.fire_cooldown
     
     def render(self, surface: pygame.Surface, x: int, y: int, grid_size: int):
         """Render the component"""
         # Base color
         color = self.stats.color
         
-        # Damage indicator (darken based on health)
-        health_percent = self.stats.health / self.stats.max_health
+        # Damage indicator (darken based on health bucket)
+        health_percent = self.damage_bucket() / self.DAMAGE_BUCKETS
         color = tuple(int(c * (0.3 + 0.7 * health_percent)) for c in color)
         
         # Draw component
@@ -143,15 +89,16 @@ class Component:
         center_x = x + grid_size // 2
         center_y = y + grid_size // 2
         
-        if self.component_type == ComponentType.CORE:
+        icon = self.stats.icon
+        if icon == "core":
             pygame.draw.circle(surface, (255, 255, 0), (center_x, center_y), 8)
-        elif self.component_type == ComponentType.ENGINE:
+        elif icon == "engine":
             pygame.draw.polygon(surface, (255, 255, 255), [
                 (center_x, center_y - 8),
                 (center_x - 6, center_y + 8),
                 (center_x + 6, center_y + 8)
             ])
-        elif self.component_type in [ComponentType.WEAPON_LASER, ComponentType.WEAPON_CANNON]:
+        elif icon == "weapon":
             pygame.draw.circle(surface, (255, 0, 0), (center_x, center_y), 4)
             pygame.draw.line(surface, (255, 0, 0), 
                            (center_x, center_y), 
@@ -5,6 +5,14 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
 
+# Simulation runs in fixed steps of SIM_DT, independent of the frame rate;
+# a frame never simulates more than MAX_FRAME_TIME so a slow frame cannot
+# snowball into ever more catch-up steps. Headless runs pay per step, so a
+# higher rate costs simulation throughput in proportion
+SIM_HZ = 120
+SIM_DT = 1 / SIM_HZ
+MAX_FRAME_TIME = 0.25
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -21,9 +29,22 @@ CYAN = (0, 255, 255)
 GRID_SIZE = 32
 GRID_COLOR = (40, 40, 40)
 
-# Physics
+# Physics; per-step factors and chances are given per REFERENCE_DT and
+# scaled to the actual step length
+REFERENCE_DT = 1 / 60
 MAX_VELOCITY = 300
-DRAG = 0.98
+DRAG = 0.98  # Velocity kept per REFERENCE_DT
+
+# Chance per REFERENCE_DT that an AI ship fires
+AI_FIRE_CHANCE = 0.02
+
+# AI decisions per second for each ship, and the most decisions made in one
+# simulation step (ships beyond it wait for a later step)
+AI_DECISION_HZ = 10
+AI_MAX_DECISIONS_PER_STEP = 32
+
+# Collision broadphase cell size (pixels)
+COLLISION_CELL_SIZE = 128
 
 # Game modes
 MODE_PLAY = "play"
@@ -0,0 +1,70 @@
+"""Batched steering and physics for many ships at once"""
+import math
+import numpy as np
+from typing import List
+from .config import DRAG, MAX_VELOCITY, REFERENCE_DT
+from .ship import Ship
+
+# Below this many ships the per-ship path is faster than gathering arrays
+BATCH_MIN_SHIPS = 48
+
+def update_fleet(ships: List[Ship], dt: float):
+    """Steer the AI-controlled ships and move all ships by one step.
+    
+    Equivalent to ship.ai_steer(dt) for AI ships followed by ship.update(dt)
+    for each ship. Larger fleets are gathered into NumPy arrays so steering,
+    thrust, drag, the speed limit and integration run as one vectorized pass.
+    """
+    if len(ships) < BATCH_MIN_SHIPS:
+        for ship in ships:
+            ship.save_previous_state()
+            ship.update_components(dt)
+            if ship.ai_controlled:
+                ship.ai_steer(dt)
+            ship.integrate(dt)
+            ship.check_stats()
+        return
+    
+    nan = math.nan
+    state = np.array([
+        (ship.x, ship.y, ship.angle, ship.vx, ship.vy, ship.angular_velocity,
+         ship.ai_heading if ship.ai_controlled and ship.ai_heading is not None else nan,
+         ship.ai_thrust,
+         ship.total_thrust if ship.power_available >= ship.power_used else 0.0)
+        for ship in ships
+    ], dtype=np.float64)
+    x, y, angle, vx, vy, angular_velocity, heading, wants_thrust, thrust = state.T
+    
+    # Steering: turn towards the decided heading, thrust once roughly facing it
+    steering = ~np.isnan(heading)
+    angle_diff = np.where(steering, (heading - angle + math.pi) % (2 * math.pi) - math.pi, 0.0)
+    turn = np.clip(Ship.AI_TURN_GAIN * angle_diff, -Ship.AI_ROTATION_SPEED, Ship.AI_ROTATION_SPEED)
+    angular_velocity = np.where(steering, turn, angular_velocity)
+    
+    force = np.where(steering & (wants_thrust != 0) & (np.abs(angle_diff) < 0.5), thrust * dt, 0.0)
+    vx = vx + np.cos(angle) * force
+    vy = vy + np.sin(angle) * force
+    
+    # Drag, scaled to the step length
+    drag = DRAG ** (dt / REFERENCE_DT)
+    vx *= drag
+    vy *= drag
+    angular_velocity *= drag
+    
+    # Speed limit
+    speed = np.hypot(vx, vy)
+    limit = np.where(speed > MAX_VELOCITY, MAX_VELOCITY / np.maximum(speed, 1e-9), 1.0)
+    vx *= limit
+    vy *= limit
+    
+    new_x = x + vx * dt
+    new_y = y + vy * dt
+    new_angle = (angle + angular_velocity * dt) % (2 * math.pi)
+    
+    for ship, values in zip(ships, zip(x.tolist(), y.tolist(), angle.tolist(), new_x.tolist(),
+                                       new_y.tolist(), new_angle.tolist(), vx.tolist(), vy.tolist(),
+                                       angular_velocity.tolist())):
+        (ship.prev_x, ship.prev_y, ship.prev_angle, ship.x, ship.y, ship.angle,
+         ship.vx, ship.vy, ship.angular_velocity) = values
+        ship.update_components(dt)
+        ship.check_stats()
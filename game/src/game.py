@@ -1,21 +1,60 @@
 """Main game class"""
 import pygame
 import math
-import random
+import time
+import numpy as np
+from dataclasses import dataclass
 from typing import List, Optional
 from .config import *
-from .ship import Ship
-from .projectile import Projectile
-from .components import Component, ComponentType
+from .ship import Ship, Layout, ENEMY_LAYOUT, PLAYER_LAYOUT
+from .projectile import ProjectilePool
+from .components import Component
 from .starfield import Starfield
 from .particles import ParticleSystem
+from .spatial import SpatialHash
+from .rng import RandomStreams
+from .ai import AIScheduler
+from .fleet import update_fleet
+from .profiler import FrameProfiler
+from .camera import Camera
+from .text_cache import TextCache, render_panel
+from .catalog import get_catalog
+from .blueprint import Blueprint, BlueprintCache
+from .replay import (PlayerInput, Replay, ReplayPlayer, COMMAND_RESET, COMMAND_PAUSE,
+                     COMMAND_MODE, COMMAND_ADD, COMMAND_REMOVE)
+
+@dataclass
+class SimulationResult:
+    """Summary of a headless simulation run"""
+    seed: int
+    ticks: int
+    sim_time: float
+    wall_time: float
+    player_destroyed: bool
+    enemies_destroyed: int
+    waves_spawned: int
+    shots_fired: int  # By all ships
+    damage_dealt: int  # By the player
+    damage_taken: int  # By the player
+    
+    @property
+    def speedup(self) -> float:
+        """Simulated seconds per wall-clock second"""
+        return self.sim_time / self.wall_time if self.wall_time > 0 else float("inf")
 
 class Game:
     """Main game class"""
     
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Subspace - Cosmoteer-Inspired Space Combat")
+    def __init__(self, headless: bool = False, particles: bool = True, seed: Optional[int] = None):
+        # Headless games have no window and are driven by simulate() or
+        # run_replay(); the player ship is flown by the same AI as the
+        # enemies unless a replay is playing
+        self.headless = headless
+        if headless:
+            self.screen = None
+        else:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("Subspace - Cosmoteer-Inspired Space Combat")
         self.clock = pygame.time.Clock()
         self.running = True
         
@@ -23,70 +62,257 @@ class Game:
         self.mode = MODE_PLAY
         self.paused = False
         self.game_time = 0  # Track time for animations
+        self.tick = 0  # Simulation steps since the last restart
+        
+        # All randomness comes from per-subsystem streams of one seed
+        self.rng = RandomStreams(seed)
+        
+        # Input recording and playback
+        self.recording: Optional[Replay] = None
+        self.replay_player: Optional[ReplayPlayer] = None
+        
+        # Fixed-step timing: unsimulated time carried to the next frame, and
+        # the smoothed wall-clock cost of one simulation step
+        self.accumulator = 0.0
+        self.sim_step_ms = 0.0
+        
+        # Per-frame subsystem timing (F3 shows it, F4 records a trace)
+        self.profiler = FrameProfiler()
+        self.show_profiler = False
+        self.trace_path = "subspace_trace.json"
         
-        # Camera
+        # Camera (the view rectangle is only used to cull rendering)
         self.camera_x = 0
         self.camera_y = 0
+        self.camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
         
-        # Enhanced starfield
-        self.starfield = Starfield()
+        # Enhanced starfield (only needed for rendering)
+        self.starfield = None if headless else Starfield(seed=self.rng.cosmetic.getrandbits(32))
         
         # Particle system
-        self.particles = ParticleSystem()
+        self.particles = ParticleSystem(enabled=particles, rng=self.rng.cosmetic)
+        
+        # Battle setup: ship layouts (None for the defaults) and whether a
+        # new wave spawns once every enemy is destroyed
+        self.player_layout: Optional[Layout] = None
+        self.enemy_layouts: Optional[List[Layout]] = None
+        self.spawn_waves = True
         
         # Game objects
         self.player: Optional[Ship] = None
         self.enemies: List[Ship] = []
-        self.projectiles: List[Projectile] = []
-        
-        # Ship builder state
-        self.builder_selected_type = ComponentType.ARMOR
-        self.builder_available_types = [
-            ComponentType.CORE,
-            ComponentType.ENGINE,
-            ComponentType.WEAPON_LASER,
-            ComponentType.WEAPON_CANNON,
-            ComponentType.ARMOR,
-            ComponentType.POWER,
-            ComponentType.SHIELD,
-        ]
-        
-        # UI
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 18)
+        self.projectiles = ProjectilePool()
+        
+        # Collision broadphase over ship bounds, kept between ticks and only
+        # re-bucketing ships that moved into other cells
+        self.collision_grid = SpatialHash(COLLISION_CELL_SIZE)
+        
+        # AI decisions run at a fixed rate, staggered across simulation steps
+        self.ai = AIScheduler(self.rng.ai)
+        
+        # Ships are spawned by cloning a prototype per layout
+        self.blueprints = BlueprintCache(sprites=not headless)
+        
+        # Ship builder state: the palette is every catalog part with a hotkey,
+        # and F5/F9 save/load the player's design
+        self.catalog = get_catalog()
+        self.builder_selected_type = self.catalog.hotkeys[min(self.catalog.hotkeys)]
+        self.blueprint_path = "player_ship.ssbp"
+        
+        # UI: text is rendered through a cache and static panels are composed once
+        if not headless:
+            self.font = pygame.font.Font(None, 24)
+            self.small_font = pygame.font.Font(None, 18)
+            self.text_cache = TextCache()
+            self._build_hud_panels()
+        
+        # Result of the last file operation (trace export, blueprint save/load),
+        # shown in the HUD until the wall-clock time status_until
+        self.status_message: Optional[str] = None
+        self.status_color = WHITE
+        self.status_until = 0.0
+        
+        # Battle statistics
+        self.shots_fired = 0
+        self.damage_dealt = 0
+        self.damage_taken = 0
+        self.enemies_destroyed = 0
+        self.waves_spawned = 0
         
         # Initialize game
         self._init_game()
     
     def _init_game(self):
         """Initialize game state"""
+        self.ai.clear()
+        self.collision_grid.clear()
+        
         # Create player ship
-        self.player = Ship(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, 0, is_player=True)
+        self.player = self.blueprints.spawn(self.player_layout or PLAYER_LAYOUT,
+                                            SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, 0, is_player=True)
+        self.player.ai_controlled = self.headless and self.replay_player is None
         
         # Create enemy ships
+        rng = self.rng.spawn
         self.enemies = []
-        for i in range(3):
-            x = random.randint(100, SCREEN_WIDTH - 100)
-            y = random.randint(100, SCREEN_HEIGHT - 100)
+        for i, layout in enumerate(self.enemy_layouts or [None] * 3):
+            x = rng.randint(100, SCREEN_WIDTH - 100)
+            y = rng.randint(100, SCREEN_HEIGHT - 100)
             # Make sure enemies don't spawn too close to player
             while math.sqrt((x - self.player.x)**2 + (y - self.player.y)**2) < 300:
-                x = random.randint(100, SCREEN_WIDTH - 100)
-                y = random.randint(100, SCREEN_HEIGHT - 100)
-            self.enemies.append(Ship(x, y, i + 1, is_player=False))
+                x = rng.randint(100, SCREEN_WIDTH - 100)
+                y = rng.randint(100, SCREEN_HEIGHT - 100)
+            self.enemies.append(self.blueprints.spawn(layout or ENEMY_LAYOUT, x, y, i + 1))
     
     def run(self):
         """Main game loop"""
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
+            frame_time = min(self.clock.tick(FPS) / 1000.0, MAX_FRAME_TIME)
+            self.profiler.begin_frame()
             
-            self._handle_events()
+            with self.profiler.section("input.events"):
+                self._handle_events()
             
-            if not self.paused:
-                self._update(dt)
-                self.game_time += dt
+            if not self.paused or self.replay_player:
+                self._step(frame_time)
             
-            self._render()
+            # Draw the state blended between the last two simulation steps
+            self._render(self.accumulator / SIM_DT)
+            self.profiler.end_frame()
+    
+    def _step(self, frame_time: float):
+        """Advance the simulation in fixed SIM_DT steps to cover a frame's time"""
+        self.accumulator += frame_time
+        steps = 0
+        start = time.perf_counter()
+        while self.accumulator >= SIM_DT:
+            self._apply_replay_commands()
+            if self.paused:
+                # Drop the unsimulated time, so rendering doesn't extrapolate
+                # past the frozen state and resuming doesn't replay it
+                self.accumulator = 0.0
+                break
+            self._update(SIM_DT)
+            self.game_time += SIM_DT
+            self.accumulator -= SIM_DT
+            steps += 1
+        
+        if steps:
+            step_ms = (time.perf_counter() - start) * 1000 / steps
+            self.sim_step_ms += (step_ms - self.sim_step_ms) * 0.1
+    
+    def _restart(self, seed: Optional[int] = None):
+        """Reseed every random stream and start a new battle from scratch"""
+        self.rng.reseed(seed)
+        self.projectiles.clear()
+        self.particles.clear()
+        self.mode = MODE_PLAY
+        self.paused = False
+        self.game_time = 0
+        self.tick = 0
+        self.accumulator = 0.0
+        self.shots_fired = 0
+        self.damage_dealt = 0
+        self.damage_taken = 0
+        self.enemies_destroyed = 0
+        self.waves_spawned = 0
+        self._init_game()
+    
+    def simulate(self, seconds: float, seed: Optional[int] = None) -> SimulationResult:
+        """Run the game update without rendering or frame limiting.
+        
+        Restarts the battle from a seed (a fresh random one if None) and
+        advances it in fixed SIM_DT steps until the time is up, the player
+        is destroyed or, with spawn_waves off, every enemy is destroyed.
+        """
+        self._restart(seed)
+        return self._run_ticks(round(seconds / SIM_DT))
+    
+    def start_recording(self, seed: Optional[int] = None):
+        """Restart the battle and record the player's inputs from now on"""
+        self.replay_player = None
+        self._restart(seed)
+        self.recording = Replay(self.rng.seed, catalog_digest=self.catalog.digest)
+    
+    def stop_recording(self) -> Replay:
+        """Finish the running recording and return it"""
+        replay = self.recording
+        replay.ticks = self.tick
+        self.recording = None
+        return replay
+    
+    def play_replay(self, replay: Replay):
+        """Restart the battle from a replay's seed and feed it the recorded inputs"""
+        self.recording = None
+        self.replay_player = ReplayPlayer(replay)
+        self._restart(replay.seed)
+    
+    def run_replay(self, replay: Replay) -> SimulationResult:
+        """Re-run a replay without rendering or frame limiting"""
+        self.play_replay(replay)
+        return self._run_ticks(replay.ticks)
+    
+    def _run_ticks(self, total_ticks: int) -> SimulationResult:
+        """Advance the battle by up to total_ticks fixed steps as fast as possible"""
+        start = time.perf_counter()
+        while self.tick < total_ticks and (self.enemies or self.spawn_waves):
+            self._apply_replay_commands()
+            if self.paused:
+                break
+            self._update(SIM_DT)
+            self.game_time += SIM_DT
+        wall_time = time.perf_counter() - start
+        
+        return SimulationResult(
+            seed=self.rng.seed,
+            ticks=self.tick,
+            sim_time=self.tick * SIM_DT,
+            wall_time=wall_time,
+            player_destroyed=self.player.is_destroyed(),
+            enemies_destroyed=self.enemies_destroyed,
+            waves_spawned=self.waves_spawned,
+            shots_fired=self.shots_fired,
+            damage_dealt=self.damage_dealt,
+            damage_taken=self.damage_taken,
+        )
+    
+    def _apply_replay_commands(self):
+        """Execute the replayed commands issued before the current tick"""
+        player = self.replay_player
+        if player is None:
+            return
+        
+        if player.finished(self.tick):
+            # End of the recording: stop and hand control back to the player
+            self.replay_player = None
+            self.paused = True
+            return
         
+        for _, command, type_index, grid_x, grid_y in player.commands_for(self.tick):
+            self._execute_command(command, type_index, grid_x, grid_y)
+    
+    def _command(self, command: int, type_index: int = 0, grid_x: int = 0, grid_y: int = 0):
+        """Issue a player command, recording it if a recording is running"""
+        if self.replay_player:
+            return  # The replay is in control
+        if self.recording:
+            self.recording.add_command(self.tick, command, type_index, grid_x, grid_y)
+        self._execute_command(command, type_index, grid_x, grid_y)
+    
+    def _execute_command(self, command: int, type_index: int, grid_x: int, grid_y: int):
+        """Apply a player command to the game state"""
+        if command == COMMAND_RESET:
+            self._init_game()
+        elif command == COMMAND_PAUSE:
+            self.paused = not self.paused
+        elif command == COMMAND_MODE:
+            self.mode = MODE_BUILD if self.mode == MODE_PLAY else MODE_PLAY
+        elif command == COMMAND_ADD:
+            if not self.player.get_component_at(grid_x, grid_y):
+                self.player.add_component(Component(self.catalog.types[type_index], grid_x, grid_y))
+        elif command == COMMAND_REMOVE:
+            self.player.remove_component(grid_x, grid_y)
+    
     def _handle_events(self):
         """Handle pygame events"""
         for event in pygame.event.get():
@@ -96,33 +322,82 @@ class Game:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.key == pygame.K_F3:
+                    self.show_profiler = not self.show_profiler
+                    self.profiler.set_enabled(self.show_profiler or self.profiler.tracing)
+                elif event.key == pygame.K_F4:
+                    self._toggle_trace()
                 elif event.key == pygame.K_p:
-                    self.paused = not self.paused
+                    self._command(COMMAND_PAUSE)
                 elif event.key == pygame.K_b:
                     # Toggle build mode
-                    self.mode = MODE_BUILD if self.mode == MODE_PLAY else MODE_PLAY
+                    self._command(COMMAND_MODE)
                 elif event.key == pygame.K_r:
                     # Reset game
-                    self._init_game()
+                    self._command(COMMAND_RESET)
                 
                 # Builder controls
                 elif self.mode == MODE_BUILD:
-                    if event.key == pygame.K_1:
-                        self.builder_selected_type = ComponentType.ARMOR
-                    elif event.key == pygame.K_2:
-                        self.builder_selected_type = ComponentType.ENGINE
-                    elif event.key == pygame.K_3:
-                        self.builder_selected_type = ComponentType.WEAPON_LASER
-                    elif event.key == pygame.K_4:
-                        self.builder_selected_type = ComponentType.WEAPON_CANNON
-                    elif event.key == pygame.K_5:
-                        self.builder_selected_type = ComponentType.POWER
-                    elif event.key == pygame.K_6:
-                        self.builder_selected_type = ComponentType.SHIELD
+                    hotkey = event.key - pygame.K_0
+                    if hotkey in self.catalog.hotkeys:
+                        self.builder_selected_type = self.catalog.hotkeys[hotkey]
+                    elif event.key == pygame.K_F5:
+                        self._save_blueprint()
+                    elif event.key == pygame.K_F9:
+                        self._load_blueprint()
             
             elif event.type == pygame.MOUSEBUTTONDOWN and self.mode == MODE_BUILD:
                 self._handle_builder_click(event.pos, event.button)
     
+    # Seconds a status message stays in the HUD
+    STATUS_SECONDS = 3.0
+    
+    def _show_status(self, message: str, color=WHITE):
+        """Show a short status message in the HUD"""
+        self.status_message = message
+        self.status_color = color
+        self.status_until = time.perf_counter() + self.STATUS_SECONDS
+    
+    def _toggle_trace(self):
+        """Start recording a profiler trace, or stop and save the running one"""
+        if self.profiler.tracing:
+            try:
+                count = self.profiler.save_trace(self.trace_path)
+                self._show_status(f"Saved {count} trace events to {self.trace_path}")
+            except OSError as e:
+                self._show_status(f"Could not save trace: {e}", RED)
+            self.profiler.set_enabled(self.show_profiler)
+        else:
+            self.profiler.start_trace()
+            self._show_status("Recording trace (F4 to save)")
+    
+    def _save_blueprint(self):
+        """Save the player's ship design to the blueprint file"""
+        try:
+            Blueprint.from_ship(self.player, "player").save(self.blueprint_path)
+            self._show_status(f"Saved blueprint to {self.blueprint_path}")
+        except (OSError, ValueError) as e:
+            self._show_status(f"Could not save blueprint: {e}", RED)
+    
+    def _load_blueprint(self):
+        """Replace the player's components with the blueprint file's design.
+        
+        The change is issued as builder remove/add commands, so recordings
+        replay it without needing the file.
+        """
+        try:
+            blueprint = Blueprint.load(self.blueprint_path)
+        except (OSError, ValueError) as e:
+            self._show_status(f"Could not load blueprint: {e}", RED)
+            return
+        
+        for _, grid_x, grid_y in self.player.get_layout():
+            self._command(COMMAND_REMOVE, 0, grid_x, grid_y)
+        for component_type, grid_x, grid_y in blueprint.layout:
+            if grid_x < self.player.grid_width and grid_y < self.player.grid_height:
+                self._command(COMMAND_ADD, self.catalog.type_id(component_type), grid_x, grid_y)
+        self._show_status(f"Loaded blueprint from {self.blueprint_path}")
+    
     def _handle_builder_click(self, pos, button):
         """Handle mouse clicks in builder mode"""
         if not self.player:
@@ -143,97 +418,68 @@ class Game:
         # Check if within bounds
         if 0 <= grid_x < self.player.grid_width and 0 <= grid_y < self.player.grid_height:
             if button == 1:  # Left click - add component
-                existing = self.player.get_component_at(grid_x, grid_y)
-                if not existing:
-                    comp = Component(self.builder_selected_type, grid_x, grid_y)
-                    self.player.add_component(comp)
+                self._command(COMMAND_ADD, self.catalog.type_id(self.builder_selected_type),
+                              grid_x, grid_y)
             elif button == 3:  # Right click - remove component
-                self.player.remove_component(grid_x, grid_y)
+                self._command(COMMAND_REMOVE, 0, grid_x, grid_y)
     
     def _update(self, dt: float):
         """Update game state"""
         # Always update particles
-        self.particles.update(dt)
+        with self.profiler.section("update.particles"):
+            self.particles.update(dt)
         
         if self.mode == MODE_PLAY:
             self._update_play_mode(dt)
         elif self.mode == MODE_BUILD:
             self._update_build_mode(dt)
+        
+        self.tick += 1
     
     def _update_play_mode(self, dt: float):
         """Update play mode"""
         if not self.player:
             return
         
-        # Handle player input
-        keys = pygame.key.get_pressed()
-        
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            self.player.apply_thrust(dt)
-        
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            self.player.rotate(-1, dt)
-        
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            self.player.rotate(1, dt)
+        profiler = self.profiler
+        firing: List[Ship] = []
+        
+        with profiler.section("update.input"):
+            if not self.player.ai_controlled:
+                # Handle player input (live or replayed)
+                if self.replay_player:
+                    controls = self.replay_player.next_input()
+                else:
+                    controls = self._read_player_input()
+                if self.recording:
+                    self.recording.add_input(controls)
+                
+                if controls.thrust:
+                    self.player.apply_thrust(dt)
+                
+                if controls.rotate:
+                    self.player.rotate(controls.rotate, dt)
+                
+                if controls.fire:
+                    firing.append(self.player)
         
-        if keys[pygame.K_SPACE]:
-            projectiles = self.player.fire_weapons()
-            self.projectiles.extend(projectiles)
-            # Create muzzle flash particles for each fired weapon
-            for proj in projectiles:
-                self.particles.create_weapon_fire_effect(proj.x, proj.y, proj.angle, proj.projectile_type)
+        with profiler.section("update.ai"):
+            pilots = [self.player] + self.enemies if self.player.ai_controlled else self.enemies
+            firing.extend(self.ai.update(dt, pilots, self._choose_ai_target, steer=False))
         
-        # Update player
-        self.player.update(dt)
+        # AI steering and movement of every ship, batched for large fleets
+        with profiler.section("update.physics"):
+            update_fleet([self.player] + self.enemies, dt)
         
-        # Update enemies
-        for enemy in self.enemies[:]:
-            enemy.update(dt, self.player)
+        with profiler.section("update.projectiles"):
+            for ship in firing:
+                self._fire(ship)
             
-            # Enemy AI firing
-            if random.random() < 0.02:  # 2% chance per frame
-                projectiles = enemy.fire_weapons()
-                self.projectiles.extend(projectiles)
-                # Create muzzle flash particles for enemy weapons
-                for proj in projectiles:
-                    self.particles.create_weapon_fire_effect(proj.x, proj.y, proj.angle, proj.projectile_type)
-            
-            # Remove destroyed enemies
-            if enemy.is_destroyed():
-                # Create large explosion when ship is destroyed
-                self.particles.create_explosion(enemy.x, enemy.y, "large")
-                self.enemies.remove(enemy)
-        
-        # Update projectiles
-        for proj in self.projectiles[:]:
-            proj.update(dt)
-            
-            if not proj.alive:
-                self.projectiles.remove(proj)
-                continue
-            
-            # Check collision with player
-            if proj.owner_id != self.player.ship_id:
-                bounds = self.player.get_bounds()
-                if proj.check_collision(bounds):
-                    self.player.take_damage(proj.damage, proj.x, proj.y)
-                    # Create impact effects
-                    self.particles.create_explosion(proj.x, proj.y, "small")
-                    self.particles.create_damage_sparks(proj.x, proj.y)
-                    proj.alive = False
-            
-            # Check collision with enemies
-            for enemy in self.enemies:
-                if proj.owner_id != enemy.ship_id:
-                    bounds = enemy.get_bounds()
-                    if proj.check_collision(bounds):
-                        enemy.take_damage(proj.damage, proj.x, proj.y)
-                        # Create impact effects
-                        self.particles.create_explosion(proj.x, proj.y, "small")
-                        self.particles.create_damage_sparks(proj.x, proj.y)
-                        proj.alive = False
-                        break
+            # Move projectiles and drop expired ones in one vectorized step
+            self.projectiles.update(dt)
+        
+        with profiler.section("update.collision"):
+            self._resolve_collisions()
         
         # Update camera to follow player
         self.camera_x = self.player.x - SCREEN_WIDTH // 2
@@ -242,88 +488,248 @@ class Game:
         # Check win/lose conditions
         if self.player.is_destroyed():
             self.paused = True
-        elif len(self.enemies) == 0:
+        elif len(self.enemies) == 0 and self.spawn_waves:
             # Spawn more enemies
+            self.waves_spawned += 1
             for i in range(3):
-                x = self.player.x + random.randint(-500, 500)
-                y = self.player.y + random.randint(-500, 500)
+                x = self.player.x + self.rng.spawn.randint(-500, 500)
+                y = self.player.y + self.rng.spawn.randint(-500, 500)
                 enemy_id = max([e.ship_id for e in self.enemies] + [self.player.ship_id]) + 1
-                self.enemies.append(Ship(x, y, enemy_id, is_player=False))
+                self.enemies.append(self.blueprints.spawn(ENEMY_LAYOUT, x, y, enemy_id))
+    
+    def _resolve_collisions(self):
+        """Apply projectile hits and remove destroyed enemies"""
+        # The broadphase is only needed while projectiles are in flight
+        if self.projectiles.count:
+            self._update_collision_grid()
+            self._apply_projectile_hits()
+        
+        # Remove destroyed enemies
+        for enemy in [e for e in self.enemies if e.is_destroyed()]:
+            # Create large explosion when ship is destroyed
+            self.particles.create_explosion(enemy.x, enemy.y, "large")
+            self.enemies.remove(enemy)
+            self.collision_grid.remove(enemy)
+            self.enemies_destroyed += 1
+    
+    def _apply_projectile_hits(self):
+        """Damage the first component each projectile's last move passed through"""
+        pool = self.projectiles
+        
+        # Only sweep projectiles whose path touches a cell holding a ship
+        left, top, right, bottom = pool.sweep_bounds()
+        candidates = self.collision_grid.overlaps_mask(left, top, right, bottom)
+        
+        for i in np.flatnonzero(candidates).tolist():
+            rect = pygame.Rect(math.floor(left[i]), math.floor(top[i]),
+                               math.floor(right[i] - left[i]) + 2,
+                               math.floor(bottom[i] - top[i]) + 2)
+            hit = self._find_projectile_hit(i, rect)
+            if hit:
+                t, ship, comp = hit
+                x0, y0 = pool.prev_x[i], pool.prev_y[i]
+                hit_x = x0 + (pool.x[i] - x0) * t
+                hit_y = y0 + (pool.y[i] - y0) * t
+                damage = ship.take_damage(int(pool.damage[i]), comp)
+                if ship is self.player:
+                    self.damage_taken += damage
+                elif pool.owner[i] == self.player.ship_id:
+                    self.damage_dealt += damage
+                # Create impact effects
+                self.particles.create_explosion(hit_x, hit_y, "small")
+                self.particles.create_damage_sparks(hit_x, hit_y)
+                pool.kill(i)
+    
+    def _read_player_input(self) -> PlayerInput:
+        """Sample the keyboard into player controls"""
+        keys = pygame.key.get_pressed()
+        rotate = 0
+        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
+            rotate -= 1
+        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
+            rotate += 1
+        return PlayerInput(
+            thrust=bool(keys[pygame.K_w] or keys[pygame.K_UP]),
+            rotate=rotate,
+            fire=bool(keys[pygame.K_SPACE]),
+        )
+    
+    def _choose_ai_target(self, ship: Ship) -> Optional[Ship]:
+        """Target of an AI ship: the player for enemies, the nearest enemy for an AI player"""
+        if ship is not self.player:
+            return self.player
+        return min(self.enemies, default=None,
+                   key=lambda e: (e.x - ship.x)**2 + (e.y - ship.y)**2)
+    
+    def _fire(self, ship: Ship):
+        """Fire a ship's weapons, with muzzle flash particles for each shot"""
+        fired = ship.fire_weapons(self.projectiles)
+        self.shots_fired += len(fired)
+        self._create_muzzle_flashes(fired)
+    
+    def _update_collision_grid(self):
+        """Move every ship's current bounds into the collision grid"""
+        for ship in [self.player] + self.enemies:
+            self.collision_grid.update(ship, ship.get_bounds())
+    
+    def _find_projectile_hit(self, i: int, sweep_rect: pygame.Rect):
+        """Find the earliest (t, ship, component) hit along projectile i's last move"""
+        pool = self.projectiles
+        owner = pool.owner[i]
+        x0, y0 = float(pool.prev_x[i]), float(pool.prev_y[i])
+        x1, y1 = float(pool.x[i]), float(pool.y[i])
+        
+        best = None
+        for ship in self.collision_grid.query_rect(sweep_rect):
+            if ship.ship_id == owner:
+                continue
+            hit = ship.raycast(x0, y0, x1, y1)
+            if hit and (best is None or hit[0] < best[0]):
+                best = (hit[0], ship, hit[1])
+        return best
+    
+    def _create_muzzle_flashes(self, slots: List[int]):
+        """Create muzzle flash particles for newly fired projectiles"""
+        pool = self.projectiles
+        for i in slots:
+            self.particles.create_weapon_fire_effect(
+                pool.x[i], pool.y[i], pool.angle[i], pool.type_name(i))
     
     def _update_build_mode(self, dt: float):
         """Update build mode"""
+        # Nothing moves while building, so pin every ship and projectile to
+        # its current state; otherwise the changing render alpha would keep
+        # blending them with their last play step
+        for ship in self.enemies:
+            ship.save_previous_state()
+        self.projectiles.save_previous_state()
+        
         if self.player:
+            self.player.save_previous_state()
+            
             # Camera follows player in build mode too
             self.camera_x = self.player.x - SCREEN_WIDTH // 2
             self.camera_y = self.player.y - SCREEN_HEIGHT // 2
     
-    def _render(self):
-        """Render everything"""
-        # Clear screen
-        self.screen.fill(BLACK)
-        
-        # Draw enhanced starfield background with parallax
-        self.starfield.render(self.screen, self.camera_x, self.camera_y, self.game_time)
-        
-        # Render game objects
+    def _render(self, alpha: float = 1.0):
+        """Render everything, interpolated by alpha between the last two simulation steps"""
+        # Follow the player's interpolated position
         if self.player:
-            self.player.render(self.screen, self.camera_x, self.camera_y)
-        
-        for enemy in self.enemies:
-            enemy.render(self.screen, self.camera_x, self.camera_y)
-        
-        for proj in self.projectiles:
-            proj.render(self.screen, self.camera_x, self.camera_y)
+            player_x, player_y, _ = self.player.get_interpolated_state(alpha)
+            self.camera_x = player_x - SCREEN_WIDTH // 2
+            self.camera_y = player_y - SCREEN_HEIGHT // 2
+        camera = self.camera
+        camera.move_to(self.camera_x, self.camera_y)
+        
+        profiler = self.profiler
+        
+        # Draw enhanced starfield background with parallax (the baked
+        # nebula background covers the whole screen, so no clear is needed)
+        with profiler.section("render.starfield"):
+            self.starfield.render(self.screen, self.camera_x, self.camera_y, self.game_time)
+        
+        # Render game objects, skipping ships whose bounds are off screen
+        with profiler.section("render.ships"):
+            ships = [self.player] + self.enemies if self.player else self.enemies
+            drawn = 0
+            for ship in ships:
+                if camera.is_visible(ship.get_bounds()):
+                    ship.render(self.screen, self.camera_x, self.camera_y, alpha)
+                    drawn += 1
+            camera.record("ships", drawn, len(ships) - drawn)
+        
+        with profiler.section("render.projectiles"):
+            drawn = self.projectiles.render(self.screen, self.camera_x, self.camera_y, alpha)
+            camera.record("projectiles", drawn, len(self.projectiles) - drawn)
         
         # Render particles on top of everything else
-        self.particles.render(self.screen, self.camera_x, self.camera_y)
+        with profiler.section("render.particles"):
+            drawn = self.particles.render(self.screen, self.camera_x, self.camera_y)
+            camera.record("particles", drawn, len(self.particles) - drawn)
         
-        # Draw UI
-        self._draw_ui()
-        
-        # Draw mode-specific overlays
-        if self.mode == MODE_BUILD:
-            self._draw_builder_ui()
-        
-        pygame.display.flip()
+        with profiler.section("render.ui"):
+            # Draw UI
+            self._draw_ui()
+            
+            # Draw mode-specific overlays
+            if self.mode == MODE_BUILD:
+                self._draw_builder_ui()
+            
+            if profiler.enabled:
+                for kind, (drawn, culled) in camera.counts.items():
+                    profiler.set_counter(kind, drawn=drawn, culled=culled)
+            if self.show_profiler:
+                profiler.render_overlay(self.screen, self.small_font, SCREEN_WIDTH - 260, SCREEN_HEIGHT - 390)
+        
+        with profiler.section("render.flip"):
+            pygame.display.flip()
+    
+    # HUD stat labels; the values next to them are drawn separately
+    STAT_LABELS = ("Health: ", "Power: ", "Enemies: ", "Mode: ", "Sim: ")
+    
+    def _build_hud_panels(self):
+        """Compose the HUD text that never changes into panels"""
+        cache = self.text_cache
+        self._stat_labels = render_panel(cache, [
+            (self.font, label, WHITE, 0, i * 30) for i, label in enumerate(self.STAT_LABELS)])
+        self._stat_value_xs = [10 + self.font.size(label)[0] for label in self.STAT_LABELS]
+        
+        self._controls_panel = render_panel(cache, [
+            (self.small_font, "WASD/Arrows: Move/Rotate | SPACE: Fire | B: Build Mode", GRAY, 0, 0),
+            (self.small_font, "P: Pause | R: Reset | F3: Profiler | F4: Trace | ESC: Quit", GRAY, 0, 20),
+        ])
+        
+        self._builder_header = render_panel(cache, [
+            (self.font, "Builder (Press B to exit)", WHITE, 0, 0),
+            (self.small_font, "Left Click: Add | Right Click: Remove", GRAY, 0, 40),
+            (self.small_font, "F5: Save design | F9: Load design", GRAY, 0, 58),
+        ])
+        
+        # Build grid overlay, rebuilt when the player's layout or grid size changes
+        self._builder_overlay: Optional[pygame.Surface] = None
+        self._builder_overlay_key = None
+        
+        # Palette panel, rebuilt when the selected component type changes
+        self._builder_palette: Optional[pygame.Surface] = None
+        self._builder_palette_selection: Optional[str] = None
     
     def _draw_ui(self):
         """Draw main UI"""
         if not self.player:
             return
         
-        # Player stats
-        y_offset = 10
-        stats = [
-            f"Health: {self.player.total_health}/{self.player.max_health}",
-            f"Power: {self.player.power_available - self.player.power_used}/{self.player.power_available}",
-            f"Enemies: {len(self.enemies)}",
-            f"Mode: {self.mode.upper()}",
+        # Player stats: static labels, and values re-rendered only when they change
+        self.screen.blit(self._stat_labels, (10, 10))
+        values = [
+            f"{self.player.total_health}/{self.player.max_health}",
+            f"{self.player.power_available - self.player.power_used}/{self.player.power_available}",
+            str(len(self.enemies)),
+            self.mode.upper(),
+            f"{self.sim_step_ms:.2f} ms/step @ {SIM_HZ} Hz",
         ]
+        if self.replay_player:
+            values.append(f"REPLAY {self.tick}/{self.replay_player.replay.ticks}")
+        elif self.recording:
+            values.append(f"REC seed {self.recording.seed}")
         
-        for stat in stats:
-            text = self.font.render(stat, True, WHITE)
-            self.screen.blit(text, (10, y_offset))
+        y_offset = 10
+        for i, value in enumerate(values):
+            x = self._stat_value_xs[i] if i < len(self.STAT_LABELS) else 10
+            self.screen.blit(self.text_cache.render(self.font, value, WHITE), (x, y_offset))
             y_offset += 30
         
-        # Controls
-        y_offset = SCREEN_HEIGHT - 100
-        controls = [
-            "WASD/Arrows: Move/Rotate | SPACE: Fire | B: Build Mode",
-            "P: Pause | R: Reset | ESC: Quit"
-        ]
-        
-        for control in controls:
-            text = self.small_font.render(control, True, GRAY)
-            self.screen.blit(text, (10, y_offset))
-            y_offset += 20
+        # Controls, with the latest status message above them
+        self.screen.blit(self._controls_panel, (10, SCREEN_HEIGHT - 100))
+        if self.status_message and time.perf_counter() < self.status_until:
+            text = self.text_cache.render(self.small_font, self.status_message, self.status_color)
+            self.screen.blit(text, (10, SCREEN_HEIGHT - 125))
         
         # Win/Lose conditions
         if self.paused:
             if self.player.is_destroyed():
-                text = self.font.render("GAME OVER! Press R to restart", True, RED)
+                text = self.text_cache.render(self.font, "GAME OVER! Press R to restart", RED)
             else:
-                text = self.font.render("PAUSED - Press P to continue", True, YELLOW)
+                text = self.text_cache.render(self.font, "PAUSED - Press P to continue", YELLOW)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             self.screen.blit(text, text_rect)
     
@@ -331,55 +737,47 @@ class Game:
         """Draw ship builder UI"""
         # Component palette
         palette_x = SCREEN_WIDTH - 200
-        palette_y = 10
-        
-        text = self.font.render("Builder (Press B to exit)", True, WHITE)
-        self.screen.blit(text, (palette_x - 50, palette_y))
-        palette_y += 40
-        
-        text = self.small_font.render("Left Click: Add | Right Click: Remove", True, GRAY)
-        self.screen.blit(text, (palette_x - 50, palette_y))
-        palette_y += 30
-        
-        # Component types
-        type_display = {
-            ComponentType.ARMOR: "1: Armor",
-            ComponentType.ENGINE: "2: Engine",
-            ComponentType.WEAPON_LASER: "3: Laser",
-            ComponentType.WEAPON_CANNON: "4: Cannon",
-            ComponentType.POWER: "5: Reactor",
-            ComponentType.SHIELD: "6: Shield",
-        }
-        
-        for comp_type in self.builder_available_types:
-            if comp_type == ComponentType.CORE:
-                continue  # Don't allow placing cores
-            
-            color = WHITE if comp_type == self.builder_selected_type else GRAY
-            text = self.small_font.render(type_display.get(comp_type, comp_type), True, color)
-            self.screen.blit(text, (palette_x, palette_y))
-            palette_y += 25
+        self.screen.blit(self._builder_header, (palette_x - 50, 10))
+        
+        if self._builder_palette is None or self._builder_palette_selection != self.builder_selected_type:
+            lines = []
+            for comp_type in self.catalog.buildable:
+                stats = self.catalog.get(comp_type)
+                color = WHITE if comp_type == self.builder_selected_type else GRAY
+                lines.append((self.small_font, f"{stats.hotkey}: {stats.name}", color, 0, len(lines) * 25))
+            self._builder_palette = render_panel(self.text_cache, lines)
+            self._builder_palette_selection = self.builder_selected_type
+        self.screen.blit(self._builder_palette, (palette_x, 100))
         
         # Draw grid overlay on player ship
         if self.player:
-            for comp in self.player.components:
-                world_x = self.player.x + (comp.grid_x - self.player.grid_width // 2) * GRID_SIZE
-                world_y = self.player.y + (comp.grid_y - self.player.grid_height // 2) * GRID_SIZE
-                
-                screen_x = int(world_x - self.camera_x)
-                screen_y = int(world_y - self.camera_y)
-                
-                pygame.draw.rect(self.screen, (255, 255, 255), 
-                               (screen_x, screen_y, GRID_SIZE, GRID_SIZE), 1)
-            
-            # Show build grid
-            for gx in range(self.player.grid_width):
-                for gy in range(self.player.grid_height):
-                    world_x = self.player.x + (gx - self.player.grid_width // 2) * GRID_SIZE
-                    world_y = self.player.y + (gy - self.player.grid_height // 2) * GRID_SIZE
-                    
-                    screen_x = int(world_x - self.camera_x)
-                    screen_y = int(world_y - self.camera_y)
-                    
-                    pygame.draw.rect(self.screen, GRID_COLOR,
-                                   (screen_x, screen_y, GRID_SIZE, GRID_SIZE), 1)
+            overlay = self._get_builder_overlay()
+            left = self.player.x - (self.player.grid_width // 2) * GRID_SIZE
+            top = self.player.y - (self.player.grid_height // 2) * GRID_SIZE
+            self.screen.blit(overlay, (int(left - self.camera_x), int(top - self.camera_y)))
+    
+    def _get_builder_overlay(self) -> pygame.Surface:
+        """Get the player's build grid and component outlines, baked until the layout or grid size changes"""
+        ship = self.player
+        key = (ship, ship.layout_version, ship.grid_width, ship.grid_height)
+        if self._builder_overlay is not None and self._builder_overlay_key == key:
+            return self._builder_overlay
+        
+        # Mostly empty lines, so a run-length encoded colour key blits fastest
+        overlay = pygame.Surface((ship.grid_width * GRID_SIZE + 1, ship.grid_height * GRID_SIZE + 1))
+        overlay.set_colorkey(BLACK, pygame.RLEACCEL)
+        
+        # Show build grid
+        for gx in range(ship.grid_width):
+            for gy in range(ship.grid_height):
+                pygame.draw.rect(overlay, GRID_COLOR,
+                                 (gx * GRID_SIZE, gy * GRID_SIZE, GRID_SIZE, GRID_SIZE), 1)
+        
+        # Outline occupied cells on top of the grid
+        for comp in ship.components:
+            pygame.draw.rect(overlay, (255, 255, 255),
+                             (comp.grid_x * GRID_SIZE, comp.grid_y * GRID_SIZE, GRID_SIZE, GRID_SIZE), 1)
+        
+        self._builder_overlay = overlay
+        self._builder_overlay_key = key
+        return overlay
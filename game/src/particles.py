@@ -2,162 +2,313 @@
 import pygame
 import math
 import random
-from typing import List, Tuple
-from dataclasses import dataclass
+import numpy as np
+from collections import OrderedDict
+from typing import Optional, Tuple
+from .config import REFERENCE_DT
+from .camera import points_in_view
 
-@dataclass
-class Particle:
-    """A single particle"""
-    x: float
-    y: float
-    vx: float
-    vy: float
-    lifetime: float
-    max_lifetime: float
-    size: float
-    color: Tuple[int, int, int]
-    fade: bool = True
-    shrink: bool = False
-    gravity: float = 0.0
+# Particle flag bits
+FLAG_FADE = 1
+FLAG_SHRINK = 2
+
+class ParticleStore:
+    """Fixed-capacity structure-of-arrays particle storage.
+    
+    Live particles always occupy the first ``count`` slots. Dead particles
+    are removed in bulk by moving live particles from the tail into the
+    holes, so removal never shifts the whole array.
+    """
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.count = 0
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.lifetime = np.zeros(capacity, dtype=np.float32)
+        self.max_lifetime = np.ones(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.gravity = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.flags = np.zeros(capacity, dtype=np.uint8)
+    
+    def add(self, x: float, y: float, vx: float, vy: float, lifetime: float,
+            max_lifetime: float, size: float, color: Tuple[int, int, int],
+            fade: bool = True, shrink: bool = False, gravity: float = 0.0) -> bool:
+        """Add a particle. Returns False if the store is full."""
+        i = self.count
+        if i >= self.capacity:
+            return False
+        
+        self.pos[i] = (x, y)
+        self.vel[i] = (vx, vy)
+        self.lifetime[i] = lifetime
+        self.max_lifetime[i] = max_lifetime
+        self.size[i] = size
+        self.gravity[i] = gravity
+        self.color[i] = color
+        self.flags[i] = (FLAG_FADE if fade else 0) | (FLAG_SHRINK if shrink else 0)
+        self.count = i + 1
+        return True
+    
+    def update(self, dt: float, drag: float):
+        """Age, compact and integrate all live particles"""
+        n = self.count
+        if n == 0:
+            return
+        
+        lifetime = self.lifetime[:n]
+        lifetime -= dt
+        
+        alive = lifetime > 0
+        n_alive = int(np.count_nonzero(alive))
+        if n_alive < n:
+            self._compact(alive, n_alive)
+            n = n_alive
+        
+        if n == 0:
+            return
+        
+        pos = self.pos[:n]
+        vel = self.vel[:n]
+        
+        # Integrate position, then gravity, then drag
+        pos += vel * dt
+        vel[:, 1] += self.gravity[:n] * dt
+        vel *= drag
+    
+    def _compact(self, alive: np.ndarray, n_alive: int):
+        """Fill dead slots below n_alive with live particles from above it"""
+        holes = np.flatnonzero(~alive[:n_alive])
+        movers = np.flatnonzero(alive[n_alive:]) + n_alive
+        
+        if len(holes):
+            for array in (self.pos, self.vel, self.lifetime, self.max_lifetime,
+                          self.size, self.gravity, self.color, self.flags):
+                array[holes] = array[movers]
+        
+        self.count = n_alive
+    
+    def clear(self):
+        """Remove all particles"""
+        self.count = 0
+
+class ParticleSpriteCache:
+    """Bounded LRU cache of pre-rendered particle sprites.
+    
+    Sprites are keyed by an integer packing the quantized colour, radius
+    and alpha bucket (see ``ParticleSystem.render``). ``hits`` and
+    ``misses`` count lookups so bucket sizes can be tuned.
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.sprites: "OrderedDict[int, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def make_keys(colors: np.ndarray, radius: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+        """Pack (r, g, b, radius, alpha) columns into integer cache keys"""
+        colors = colors.astype(np.int64)
+        return ((colors[:, 0] << 32) | (colors[:, 1] << 24) | (colors[:, 2] << 16) |
+                (radius.astype(np.int64) << 8) | alpha.astype(np.int64))
+    
+    def get(self, key: int) -> pygame.Surface:
+        """Get the sprite for a packed key, rendering it on a miss"""
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self.sprites.move_to_end(key)
+            return sprite
+        
+        self.misses += 1
+        color = ((key >> 32) & 0xFF, (key >> 24) & 0xFF, (key >> 16) & 0xFF, key & 0xFF)
+        radius = (key >> 8) & 0xFF
+        sprite = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius + 1, radius + 1), radius)
+        
+        self.sprites[key] = sprite
+        if len(self.sprites) > self.max_entries:
+            self.sprites.popitem(last=False)
+            self.evictions += 1
+        return sprite
+    
+    def reset_stats(self):
+        """Reset hit/miss/eviction counters"""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def clear(self):
+        """Drop all cached sprites"""
+        self.sprites.clear()
 
 class ParticleSystem:
     """Manages all particles in the game"""
     
-    # Particle physics constants
+    # Particle physics constants (drag is velocity kept per REFERENCE_DT)
     PARTICLE_DRAG = 0.98
     
-    def __init__(self):
-        self.particles: List[Particle] = []
+    # Maximum number of live particles
+    MAX_PARTICLES = 32768
+    
+    # Sprite cache quantization (colour step, alpha bucket width) and size
+    SPRITE_COLOR_STEP = 8
+    SPRITE_ALPHA_STEP = 16
+    SPRITE_CACHE_SIZE = 1024
+    
+    def __init__(self, capacity: int = MAX_PARTICLES, enabled: bool = True,
+                 rng: Optional[random.Random] = None):
+        self.store = ParticleStore(capacity)
+        self.sprite_cache = ParticleSpriteCache(self.SPRITE_CACHE_SIZE)
+        self.enabled = enabled  # When False, emitters create no particles
+        
+        # Cosmetic randomness only, kept apart from gameplay randomness
+        self.rng = rng if rng is not None else random.Random()
+    
+    def __len__(self) -> int:
+        return self.store.count
     
     def update(self, dt: float):
         """Update all particles"""
-        # Iterate backwards to safely remove particles
-        for i in range(len(self.particles) - 1, -1, -1):
-            particle = self.particles[i]
-            particle.lifetime -= dt
-            
-            if particle.lifetime <= 0:
-                self.particles.pop(i)
-                continue
-            
-            # Update position
-            particle.x += particle.vx * dt
-            particle.y += particle.vy * dt
-            
-            # Apply gravity
-            if particle.gravity != 0:
-                particle.vy += particle.gravity * dt
-            
-            # Apply drag
-            particle.vx *= self.PARTICLE_DRAG
-            particle.vy *= self.PARTICLE_DRAG
+        self.store.update(dt, self.PARTICLE_DRAG ** (dt / REFERENCE_DT))
     
-    def render(self, surface: pygame.Surface, camera_x: float, camera_y: float):
-        """Render all particles"""
-        for particle in self.particles:
-            screen_x = int(particle.x - camera_x)
-            screen_y = int(particle.y - camera_y)
-            
-            # Skip if off screen
-            if screen_x < -10 or screen_x > surface.get_width() + 10:
-                continue
-            if screen_y < -10 or screen_y > surface.get_height() + 10:
-                continue
-            
-            # Calculate alpha based on lifetime
-            alpha = 255
-            if particle.fade:
-                alpha = int(255 * (particle.lifetime / particle.max_lifetime))
-                alpha = max(0, min(255, alpha))
-            
-            # Calculate size
-            size = particle.size
-            if particle.shrink:
-                size = particle.size * (particle.lifetime / particle.max_lifetime)
-                size = max(0.5, size)
-            
-            # Render particle
-            color = particle.color
-            if alpha < 250 and particle.fade:
-                # Use alpha blending for fading particles
-                temp_surface = pygame.Surface((int(size * 2 + 2), int(size * 2 + 2)), pygame.SRCALPHA)
-                color_with_alpha = (*color, alpha)
-                pygame.draw.circle(temp_surface, color_with_alpha, 
-                                 (int(size + 1), int(size + 1)), int(size))
-                surface.blit(temp_surface, (screen_x - int(size + 1), screen_y - int(size + 1)))
-            else:
-                # Direct rendering for fully opaque particles (faster)
-                pygame.draw.circle(surface, color, (screen_x, screen_y), int(size))
+    def render(self, surface: pygame.Surface, camera_x: float, camera_y: float) -> int:
+        """Render all on-screen particles. Returns the number drawn."""
+        store = self.store
+        n = store.count
+        if n == 0:
+            return 0
+        
+        screen_x = (store.pos[:n, 0] - camera_x).astype(np.int32)
+        screen_y = (store.pos[:n, 1] - camera_y).astype(np.int32)
+        
+        # Skip if off screen
+        visible = points_in_view(screen_x, screen_y, surface.get_width(), surface.get_height(), 10)
+        indices = np.flatnonzero(visible)
+        if len(indices) == 0:
+            return 0
+        
+        flags = store.flags[indices]
+        life_ratio = store.lifetime[indices] / store.max_lifetime[indices]
+        fade = (flags & FLAG_FADE) != 0
+        
+        # Calculate alpha based on lifetime
+        alpha = np.where(fade, np.clip((255 * life_ratio).astype(np.int32), 0, 255), 255)
+        
+        # Calculate size
+        size = store.size[indices]
+        size = np.where((flags & FLAG_SHRINK) != 0, np.maximum(0.5, size * life_ratio), size)
+        
+        radius = size.astype(np.int32)
+        
+        # Fading particles use a quantized alpha bucket, the rest are opaque
+        translucent = fade & (alpha < 250)
+        step = self.SPRITE_ALPHA_STEP
+        alpha = np.where(translucent, (alpha // step) * step + step // 2, 255)
+        
+        # Zero-radius circles draw nothing
+        drawn = radius >= 1
+        if not drawn.all():
+            indices = indices[drawn]
+            radius = radius[drawn]
+            alpha = alpha[drawn]
+        
+        step = self.SPRITE_COLOR_STEP
+        colors = np.minimum(255, ((store.color[indices].astype(np.int32) + step // 2) // step) * step)
+        keys = ParticleSpriteCache.make_keys(colors, radius, alpha)
+        
+        # Look up each distinct sprite once, then blit everything in one batch
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        sprites = [self.sprite_cache.get(key) for key in unique_keys.tolist()]
+        
+        offset = radius + 1
+        blit_x = (screen_x[indices] - offset).tolist()
+        blit_y = (screen_y[indices] - offset).tolist()
+        batch = [(sprites[k], (bx, by)) for k, bx, by in zip(inverse.tolist(), blit_x, blit_y)]
+        
+        fblits = getattr(surface, "fblits", None)
+        if fblits is not None:
+            fblits(batch)
+        else:
+            surface.blits(batch, False)
+        return len(batch)
     
     def create_weapon_fire_effect(self, x: float, y: float, angle: float, weapon_type: str):
         """Create particles for weapon firing"""
+        if not self.enabled:
+            return
+        
         if weapon_type == "laser":
             # Laser muzzle flash - bright and quick
             for _ in range(8):
-                speed = random.uniform(30, 60)
-                spread = random.uniform(-0.3, 0.3)
+                speed = self.rng.uniform(30, 60)
+                spread = self.rng.uniform(-0.3, 0.3)
                 particle_angle = angle + spread
                 vx = math.cos(particle_angle) * speed
                 vy = math.sin(particle_angle) * speed
                 
-                color = random.choice([
+                color = self.rng.choice([
                     (255, 100, 100),
                     (255, 150, 150),
                     (255, 200, 200),
                 ])
                 
-                particle = Particle(
+                self.store.add(
                     x=x,
                     y=y,
                     vx=vx,
                     vy=vy,
                     lifetime=0.2,
                     max_lifetime=0.2,
-                    size=random.uniform(2, 4),
+                    size=self.rng.uniform(2, 4),
                     color=color,
                     fade=True,
                     shrink=True
                 )
-                self.particles.append(particle)
         
         else:  # cannon
             # Cannon smoke and fire
             for _ in range(15):
-                speed = random.uniform(20, 50)
-                spread = random.uniform(-0.5, 0.5)
+                speed = self.rng.uniform(20, 50)
+                spread = self.rng.uniform(-0.5, 0.5)
                 particle_angle = angle + spread
                 vx = math.cos(particle_angle) * speed
                 vy = math.sin(particle_angle) * speed
                 
                 # Mix of fire and smoke colors
-                if random.random() < 0.6:
-                    color = random.choice([
+                if self.rng.random() < 0.6:
+                    color = self.rng.choice([
                         (255, 200, 0),   # Yellow fire
                         (255, 150, 0),   # Orange fire
                         (255, 100, 0),   # Red-orange
                     ])
                 else:
-                    color = random.choice([
+                    color = self.rng.choice([
                         (100, 100, 100), # Gray smoke
                         (150, 150, 150), # Light smoke
                     ])
                 
-                particle = Particle(
+                self.store.add(
                     x=x,
                     y=y,
                     vx=vx,
                     vy=vy,
-                    lifetime=random.uniform(0.3, 0.5),
+                    lifetime=self.rng.uniform(0.3, 0.5),
                     max_lifetime=0.5,
-                    size=random.uniform(3, 6),
+                    size=self.rng.uniform(3, 6),
                     color=color,
                     fade=True,
                     shrink=False
                 )
-                self.particles.append(particle)
     
     def create_explosion(self, x: float, y: float, size: str = "medium"):
         """Create an explosion effect"""
+        if not self.enabled:
+            return
+        
         # Determine explosion parameters based on size
         if size == "small":
             num_particles = 20
@@ -177,13 +328,13 @@ class ParticleSystem:
         
         # Create explosion particles
         for _ in range(num_particles):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(*speed_range)
+            angle = self.rng.uniform(0, math.pi * 2)
+            speed = self.rng.uniform(*speed_range)
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
             
             # Mix of fire colors
-            color = random.choice([
+            color = self.rng.choice([
                 (255, 200, 0),   # Yellow
                 (255, 150, 0),   # Orange
                 (255, 100, 0),   # Red-orange
@@ -191,115 +342,117 @@ class ParticleSystem:
                 (200, 200, 200), # White-hot
             ])
             
-            lifetime = random.uniform(*lifetime_range)
-            particle = Particle(
+            lifetime = self.rng.uniform(*lifetime_range)
+            self.store.add(
                 x=x,
                 y=y,
                 vx=vx,
                 vy=vy,
                 lifetime=lifetime,
                 max_lifetime=lifetime,
-                size=random.uniform(*size_range),
+                size=self.rng.uniform(*size_range),
                 color=color,
                 fade=True,
                 shrink=True
             )
-            self.particles.append(particle)
         
         # Add smoke particles
         for _ in range(num_particles // 2):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(20, 80)
+            angle = self.rng.uniform(0, math.pi * 2)
+            speed = self.rng.uniform(20, 80)
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
             
-            color = random.choice([
+            color = self.rng.choice([
                 (80, 80, 80),
                 (100, 100, 100),
                 (120, 120, 120),
             ])
             
-            lifetime = random.uniform(0.5, 1.2)
-            particle = Particle(
+            lifetime = self.rng.uniform(0.5, 1.2)
+            self.store.add(
                 x=x,
                 y=y,
                 vx=vx,
                 vy=vy,
                 lifetime=lifetime,
                 max_lifetime=lifetime,
-                size=random.uniform(4, 8),
+                size=self.rng.uniform(4, 8),
                 color=color,
                 fade=True,
                 shrink=False,
                 gravity=20  # Smoke rises slowly
             )
-            self.particles.append(particle)
     
     def create_engine_thrust(self, x: float, y: float, angle: float, power: float = 1.0):
         """Create engine thrust particles"""
+        if not self.enabled:
+            return
+        
         # Create 2-3 particles per frame when engine is active
-        num_particles = random.randint(2, 3)
+        num_particles = self.rng.randint(2, 3)
         
         for _ in range(num_particles):
             # Thrust goes opposite to engine direction
             thrust_angle = angle + math.pi
-            spread = random.uniform(-0.2, 0.2)
+            spread = self.rng.uniform(-0.2, 0.2)
             particle_angle = thrust_angle + spread
             
-            speed = random.uniform(80, 150) * power
+            speed = self.rng.uniform(80, 150) * power
             vx = math.cos(particle_angle) * speed
             vy = math.sin(particle_angle) * speed
             
             # Blue engine glow
-            color = random.choice([
+            color = self.rng.choice([
                 (100, 150, 255),
                 (150, 200, 255),
                 (200, 220, 255),
             ])
             
-            particle = Particle(
+            self.store.add(
                 x=x,
                 y=y,
                 vx=vx,
                 vy=vy,
-                lifetime=random.uniform(0.1, 0.3),
+                lifetime=self.rng.uniform(0.1, 0.3),
                 max_lifetime=0.3,
-                size=random.uniform(2, 4),
+                size=self.rng.uniform(2, 4),
                 color=color,
                 fade=True,
                 shrink=True
             )
-            self.particles.append(particle)
     
     def create_damage_sparks(self, x: float, y: float):
         """Create sparks when component takes damage"""
+        if not self.enabled:
+            return
+        
         for _ in range(10):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(80, 150)
+            angle = self.rng.uniform(0, math.pi * 2)
+            speed = self.rng.uniform(80, 150)
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
             
-            color = random.choice([
+            color = self.rng.choice([
                 (255, 255, 0),   # Yellow sparks
                 (255, 200, 0),   # Orange sparks
                 (255, 255, 255), # White sparks
             ])
             
-            particle = Particle(
+            self.store.add(
                 x=x,
                 y=y,
                 vx=vx,
                 vy=vy,
-                lifetime=random.uniform(0.2, 0.4),
+                lifetime=self.rng.uniform(0.2, 0.4),
                 max_lifetime=0.4,
-                size=random.uniform(1, 3),
+                size=self.rng.uniform(1, 3),
                 color=color,
                 fade=True,
                 shrink=True,
                 gravity=200  # Sparks fall
             )
-            self.particles.append(particle)
     
     def clear(self):
         """Remove all particles"""
-        self.particles.clear()
+        self.store.clear()
@@ -0,0 +1,232 @@
+"""Lightweight per-frame profiling of game subsystems"""
+import json
+import time
+import pygame
+from collections import deque
+from typing import Deque, Dict, List, Tuple
+from .config import FPS, WHITE, GRAY
+
+class _Section:
+    """Context manager adding the time spent inside it to a profiler section"""
+    __slots__ = ("profiler", "name", "start")
+    
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        end = time.perf_counter()
+        profiler = self.profiler
+        frame = profiler.frame
+        frame[self.name] = frame.get(self.name, 0.0) + (end - self.start)
+        if profiler.tracing:
+            profiler.events.append((self.name, self.start, end - self.start))
+        return False
+
+class _NullSection:
+    """Context manager that does nothing, handed out while profiling is off"""
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+NULL_SECTION = _NullSection()
+
+class FrameProfiler:
+    """Times named sections of each frame, for an on-screen graph and trace export.
+    
+    Wrap work in ``with profiler.section("name"):``. While the profiler is
+    disabled this returns a shared no-op context manager, so instrumented
+    code costs one method call per section.
+    """
+    
+    # Frames kept for the overlay graph and averages
+    HISTORY_FRAMES = 240
+    
+    # Overlay graph height and the frame time it represents
+    GRAPH_HEIGHT = 120
+    GRAPH_MS = 33.3
+    
+    # Trace recording stops by itself after this many events
+    MAX_TRACE_EVENTS = 2_000_000
+    
+    COLORS = [
+        (230, 80, 80), (240, 160, 60), (230, 220, 70), (120, 220, 90),
+        (70, 200, 200), (80, 140, 240), (170, 110, 240), (230, 110, 200),
+        (200, 200, 200), (150, 110, 70), (110, 160, 110), (120, 120, 180),
+        (250, 250, 250), (60, 120, 60), (180, 60, 120), (100, 180, 250),
+    ]
+    
+    def __init__(self):
+        self.enabled = False
+        self.tracing = False
+        
+        # Section times (seconds) of the frame in progress
+        self.frame: Dict[str, float] = {}
+        self.frame_start = 0.0
+        
+        # (frame time, section times) of recent frames
+        self.history: Deque[Tuple[float, Dict[str, float]]] = deque(maxlen=self.HISTORY_FRAMES)
+        self.frame_count = 0
+        
+        self._sections: Dict[str, _Section] = {}
+        self.section_names: List[str] = []  # In first-use order, which fixes their colours
+        
+        # Trace events as (name, start, duration) in perf_counter seconds
+        self.events: List[Tuple[str, float, float]] = []
+        
+        # Latest values of named counters (e.g. drawn/culled entities), and
+        # their changes over time as (name, time, values) while tracing
+        self.counters: Dict[str, Dict[str, int]] = {}
+        self.counter_events: List[Tuple[str, float, Dict[str, int]]] = []
+        
+        # Scrolling graph, one column per frame
+        self._graph = pygame.Surface((self.HISTORY_FRAMES, self.GRAPH_HEIGHT))
+        self._graph_frames = 0
+    
+    def set_enabled(self, enabled: bool):
+        """Turn section timing on or off"""
+        self.enabled = enabled
+        self.frame = {}
+        self.frame_start = time.perf_counter()
+        if not enabled:
+            self.tracing = False
+    
+    def section(self, name: str):
+        """Get a context manager timing a named section of the current frame"""
+        if not self.enabled:
+            return NULL_SECTION
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, name)
+            self.section_names.append(name)
+        return section
+    
+    def set_counter(self, name: str, **values: int):
+        """Set the current values of a named counter, e.g. set_counter("ships", drawn=3, culled=9)"""
+        self.counters[name] = values
+        if self.tracing:
+            self.counter_events.append((name, time.perf_counter(), values))
+    
+    def begin_frame(self):
+        """Start timing a new frame"""
+        if self.enabled:
+            self.frame = {}
+            self.frame_start = time.perf_counter()
+    
+    def end_frame(self):
+        """Finish the current frame and add it to the history"""
+        if not self.enabled:
+            return
+        total = time.perf_counter() - self.frame_start
+        self.history.append((total, self.frame))
+        self.frame_count += 1
+        if self.tracing:
+            self.events.append(("frame", self.frame_start, total))
+            if len(self.events) >= self.MAX_TRACE_EVENTS:
+                self.tracing = False
+    
+    def start_trace(self):
+        """Enable profiling and start recording trace events"""
+        self.set_enabled(True)
+        self.events = []
+        self.counter_events = []
+        self.tracing = True
+    
+    def save_trace(self, path: str) -> int:
+        """Stop recording and write the events as Chrome trace-event JSON.
+        
+        Returns the number of events written. Open the file in
+        chrome://tracing or https://ui.perfetto.dev.
+        """
+        self.tracing = False
+        origin = min((start for _, start, _ in self.events), default=0.0)
+        trace = {
+            "traceEvents": [
+                {"name": name, "cat": name.split(".")[0], "ph": "X", "pid": 0, "tid": 0,
+                 "ts": (start - origin) * 1e6, "dur": duration * 1e6}
+                for name, start, duration in self.events
+            ] + [
+                {"name": name, "cat": "counter", "ph": "C", "pid": 0, "tid": 0,
+                 "ts": (start - origin) * 1e6, "args": values}
+                for name, start, values in self.counter_events
+            ],
+            "displayTimeUnit": "ms",
+        }
+        with open(path, "w") as f:
+            json.dump(trace, f)
+        return len(trace["traceEvents"])
+    
+    def averages(self) -> Dict[str, float]:
+        """Mean time per frame of each section over the history, in milliseconds"""
+        if not self.history:
+            return {}
+        totals = dict.fromkeys(self.section_names, 0.0)
+        for _, sections in self.history:
+            for name, duration in sections.items():
+                totals[name] += duration
+        return {name: total * 1000 / len(self.history) for name, total in totals.items()}
+    
+    def _color(self, name: str) -> Tuple[int, int, int]:
+        """Colour of a section in the overlay"""
+        return self.COLORS[self.section_names.index(name) % len(self.COLORS)]
+    
+    def _update_graph(self):
+        """Scroll frames added since the last draw into the graph"""
+        new_frames = min(self.frame_count - self._graph_frames, len(self.history))
+        self._graph_frames = self.frame_count
+        if new_frames <= 0:
+            return
+        
+        graph = self._graph
+        height = self.GRAPH_HEIGHT
+        scale = height / self.GRAPH_MS
+        graph.scroll(-new_frames, 0)
+        x = self.HISTORY_FRAMES - new_frames
+        for total, sections in list(self.history)[-new_frames:]:
+            graph.fill((0, 0, 0), (x, 0, 1, height))
+            
+            # Stack the sections from the bottom, then the untimed rest of the frame
+            y = height
+            for name in self.section_names:
+                bar = sections.get(name, 0.0) * 1000 * scale
+                if bar > 0:
+                    graph.fill(self._color(name), (x, round(y - bar), 1, max(1, round(y) - round(y - bar))))
+                    y -= bar
+            rest = total * 1000 * scale
+            if rest > height - y:
+                graph.fill((70, 70, 70), (x, round(height - rest), 1, max(1, round(y) - round(height - rest))))
+            x += 1
+        
+        # Frame budget line
+        budget_y = height - round(1000 / FPS * scale)
+        graph.fill(GRAY, (0, budget_y, self.HISTORY_FRAMES, 1))
+    
+    def render_overlay(self, surface: pygame.Surface, font: pygame.font.Font, x: int, y: int):
+        """Draw the frame-time graph and per-section averages"""
+        self._update_graph()
+        surface.blit(self._graph, (x, y))
+        pygame.draw.rect(surface, GRAY, (x - 1, y - 1, self.HISTORY_FRAMES + 2, self.GRAPH_HEIGHT + 2), 1)
+        
+        frame_ms = sum(total for total, _ in self.history) * 1000 / max(1, len(self.history))
+        title = f"Frame {frame_ms:.2f} ms" + ("  [TRACING]" if self.tracing else "")
+        surface.blit(font.render(title, True, WHITE), (x, y + self.GRAPH_HEIGHT + 4))
+        
+        line_y = y + self.GRAPH_HEIGHT + 20
+        for name, average in self.averages().items():
+            pygame.draw.rect(surface, self._color(name), (x, line_y + 3, 8, 8))
+            surface.blit(font.render(f"{name} {average:.2f} ms", True, WHITE), (x + 12, line_y))
+            line_y += 14
+        
+        for name, values in self.counters.items():
+            text = f"{name}: " + "  ".join(f"{key} {value}" for key, value in values.items())
+            surface.blit(font.render(text, True, GRAY), (x, line_y))
+            line_y += 14
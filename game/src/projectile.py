@@ -1,7 +1,36 @@
 """Projectile system"""
 import pygame
 import math
-from typing import Optional
+import numpy as np
+from typing import Optional, Tuple
+from .camera import points_in_view
+
+# Projectile type names, indexed by the pool's integer type ids
+PROJECTILE_TYPES = ("laser", "cannon")
+
+# Visual properties per projectile type: (color, size)
+PROJECTILE_STYLES = {
+    "laser": ((255, 50, 50), 3),
+    "cannon": ((255, 200, 0), 5),
+}
+
+def draw_projectile(surface: pygame.Surface, projectile_type: str,
+                    screen_x: int, screen_y: int, angle: float):
+    """Draw a projectile at a screen position"""
+    color, size = PROJECTILE_STYLES[projectile_type]
+    
+    # Draw projectile with trail effect
+    if projectile_type == "laser":
+        # Laser beam effect
+        trail_length = 15
+        end_x = screen_x - int(math.cos(angle) * trail_length)
+        end_y = screen_y - int(math.sin(angle) * trail_length)
+        pygame.draw.line(surface, color, (end_x, end_y), (screen_x, screen_y), 2)
+        pygame.draw.circle(surface, (255, 255, 255), (screen_x, screen_y), size)
+    else:
+        # Cannon projectile
+        pygame.draw.circle(surface, color, (screen_x, screen_y), size)
+        pygame.draw.circle(surface, (255, 255, 0), (screen_x, screen_y), size // 2)
 
 class Projectile:
     """A projectile fired from a weapon"""
@@ -23,12 +52,7 @@ class Projectile:
         self.vy = math.sin(angle) * speed
         
         # Visual properties
-        if projectile_type == "laser":
-            self.color = (255, 50, 50)
-            self.size = 3
-        else:  # cannon
-            self.color = (255, 200, 0)
-            self.size = 5
+        self.color, self.size = PROJECTILE_STYLES[projectile_type]
     
     def update(self, dt: float):
         """Update projectile position"""
@@ -49,20 +73,130 @@ class Projectile:
         
         screen_x = int(self.x - camera_x)
         screen_y = int(self.y - camera_y)
+        draw_projectile(surface, self.projectile_type, screen_x, screen_y, self.angle)
+
+class ProjectilePool:
+    """Fixed-capacity pool of projectiles stored in typed arrays.
+    
+    Live projectiles occupy the first ``count`` slots, so ``pool.x[:pool.count]``
+    and friends are views over every projectile in flight. Slot indices stay
+    valid until the next ``update``, which compacts expired projectiles away.
+    """
+    
+    # Maximum number of projectiles in flight
+    MAX_PROJECTILES = 8192
+    
+    # Seconds before a projectile expires
+    LIFETIME = 3.0
+    
+    def __init__(self, capacity: int = MAX_PROJECTILES):
+        self.capacity = capacity
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.prev_x = np.zeros(capacity, dtype=np.float64)  # Position at the start of the last update
+        self.prev_y = np.zeros(capacity, dtype=np.float64)
+        self.vx = np.zeros(capacity, dtype=np.float64)
+        self.vy = np.zeros(capacity, dtype=np.float64)
+        self.angle = np.zeros(capacity, dtype=np.float64)
+        self.lifetime = np.zeros(capacity, dtype=np.float64)
+        self.damage = np.zeros(capacity, dtype=np.int32)
+        self.type = np.zeros(capacity, dtype=np.uint8)
+        self.owner = np.zeros(capacity, dtype=np.int32)
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def spawn(self, x: float, y: float, angle: float, speed: float,
+              damage: int, projectile_type: int, owner_id: int) -> int:
+        """Add a projectile of a PROJECTILE_TYPES index. Returns its slot index, or -1 if the pool is full."""
+        i = self.count
+        if i >= self.capacity:
+            return -1
+        
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.vx[i] = math.cos(angle) * speed
+        self.vy[i] = math.sin(angle) * speed
+        self.angle[i] = angle
+        self.lifetime[i] = self.LIFETIME
+        self.damage[i] = damage
+        self.type[i] = projectile_type
+        self.owner[i] = owner_id
+        self.count = i + 1
+        return i
+    
+    def type_name(self, i: int) -> str:
+        """Get the type name of the projectile in a slot"""
+        return PROJECTILE_TYPES[self.type[i]]
+    
+    def kill(self, i: int):
+        """Expire a projectile; it is removed on the next update"""
+        self.lifetime[i] = 0
+    
+    def update(self, dt: float):
+        """Move all projectiles and remove expired ones"""
+        n = self.count
+        if n == 0:
+            return
         
-        # Draw projectile with trail effect
-        if self.projectile_type == "laser":
-            # Laser beam effect
-            trail_length = 15
-            end_x = screen_x - int(math.cos(self.angle) * trail_length)
-            end_y = screen_y - int(math.sin(self.angle) * trail_length)
-            pygame.draw.line(surface, self.color, (end_x, end_y), (screen_x, screen_y), 2)
-            pygame.draw.circle(surface, (255, 255, 255), (screen_x, screen_y), self.size)
-        else:
-            # Cannon projectile
-            pygame.draw.circle(surface, self.color, (screen_x, screen_y), self.size)
-            pygame.draw.circle(surface, (255, 255, 0), (screen_x, screen_y), self.size // 2)
-    
-    def check_collision(self, rect: pygame.Rect) -> bool:
-        """Check if projectile collides with a rectangle"""
-        return rect.collidepoint(int(self.x), int(self.y))
+        x, y = self.x[:n], self.y[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        x += self.vx[:n] * dt
+        y += self.vy[:n] * dt
+        
+        lifetime = self.lifetime[:n]
+        lifetime -= dt
+        
+        alive = lifetime > 0
+        n_alive = int(np.count_nonzero(alive))
+        if n_alive < n:
+            # Move live projectiles from the tail into the dead slots
+            holes = np.flatnonzero(~alive[:n_alive])
+            movers = np.flatnonzero(alive[n_alive:]) + n_alive
+            if len(holes):
+                for array in (self.x, self.y, self.prev_x, self.prev_y, self.vx, self.vy,
+                              self.angle, self.lifetime, self.damage, self.type, self.owner):
+                    array[holes] = array[movers]
+            self.count = n_alive
+    
+    def save_previous_state(self):
+        """Make the current positions the interpolation start, e.g. while the pool is frozen"""
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+    
+    def sweep_bounds(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get (left, top, right, bottom) of each live projectile's last move"""
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        prev_x, prev_y = self.prev_x[:n], self.prev_y[:n]
+        return (np.minimum(x, prev_x), np.minimum(y, prev_y),
+                np.maximum(x, prev_x), np.maximum(y, prev_y))
+    
+    def render(self, surface: pygame.Surface, camera_x: float, camera_y: float, alpha: float = 1.0) -> int:
+        """Render on-screen projectiles, interpolated by alpha between their last two updates.
+        Returns the number drawn."""
+        n = self.count
+        if n == 0:
+            return 0
+        
+        prev_x, prev_y = self.prev_x[:n], self.prev_y[:n]
+        screen_x = (prev_x + (self.x[:n] - prev_x) * alpha - camera_x).astype(np.int32)
+        screen_y = (prev_y + (self.y[:n] - prev_y) * alpha - camera_y).astype(np.int32)
+        
+        # Skip killed and off-screen projectiles (with room for laser trails)
+        margin = 20
+        visible = (self.lifetime[:n] > 0) & points_in_view(screen_x, screen_y, surface.get_width(),
+                                                           surface.get_height(), margin)
+        indices = np.flatnonzero(visible)
+        
+        for sx, sy, angle, type_id in zip(screen_x[indices].tolist(), screen_y[indices].tolist(),
+                                          self.angle[indices].tolist(), self.type[indices].tolist()):
+            draw_projectile(surface, PROJECTILE_TYPES[type_id], sx, sy, angle)
+        return len(indices)
+    
+    def clear(self):
+        """Remove all projectiles"""
+        self.count = 0
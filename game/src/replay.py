@@ -0,0 +1,148 @@
+"""Recording and playback of player inputs for reproducible games"""
+import struct
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+from .catalog import get_catalog
+from .config import SIM_HZ
+
+@dataclass
+class PlayerInput:
+    """Player controls for one update"""
+    thrust: bool = False
+    rotate: int = 0  # -1 left, 1 right, 0 none
+    fire: bool = False
+
+# Input bits, one byte per tick
+INPUT_THRUST = 1
+INPUT_LEFT = 2
+INPUT_RIGHT = 4
+INPUT_FIRE = 8
+
+# Commands issued between ticks, stored as (tick, command, type_index, grid_x, grid_y)
+COMMAND_RESET = 0
+COMMAND_PAUSE = 1
+COMMAND_MODE = 2
+COMMAND_ADD = 3  # Builder: add a component of catalog type id type_index
+COMMAND_REMOVE = 4  # Builder: remove the component at the grid position
+
+Command = Tuple[int, int, int, int, int]
+
+def encode_input(controls: PlayerInput) -> int:
+    """Pack player controls into input bits"""
+    return ((INPUT_THRUST if controls.thrust else 0) |
+            (INPUT_LEFT if controls.rotate < 0 else 0) |
+            (INPUT_RIGHT if controls.rotate > 0 else 0) |
+            (INPUT_FIRE if controls.fire else 0))
+
+def decode_input(bits: int) -> PlayerInput:
+    """Unpack input bits into player controls"""
+    return PlayerInput(
+        thrust=bool(bits & INPUT_THRUST),
+        rotate=(1 if bits & INPUT_RIGHT else 0) - (1 if bits & INPUT_LEFT else 0),
+        fire=bool(bits & INPUT_FIRE),
+    )
+
+class Replay:
+    """The seed, per-tick player inputs and commands of one recorded game.
+    
+    Inputs are stored run-length encoded, since held keys repeat the same
+    input for many ticks. Commands refer to parts by catalog type id, so the
+    replay also records the digest of the catalog it was made with.
+    """
+    
+    MAGIC = b"SSRP"
+    VERSION = 2
+    HEADER = struct.Struct("<4sBQH8sIII")  # magic, version, seed, sim_hz, catalog digest, ticks, runs, commands
+    RUN = struct.Struct("<HB")  # count, input bits
+    COMMAND = struct.Struct("<IBHHH")  # tick, command, type_index, grid_x, grid_y
+    
+    def __init__(self, seed: int, sim_hz: int = SIM_HZ, catalog_digest: Optional[bytes] = None):
+        self.seed = seed
+        self.sim_hz = sim_hz
+        self.catalog_digest = get_catalog().digest if catalog_digest is None else catalog_digest
+        self.ticks = 0  # Simulation steps covered by the recording
+        self.input_runs: List[List[int]] = []  # [count, input bits]
+        self.commands: List[Command] = []
+    
+    def add_input(self, controls: PlayerInput):
+        """Append the player controls read in one tick"""
+        bits = encode_input(controls)
+        if self.input_runs and self.input_runs[-1][1] == bits and self.input_runs[-1][0] < 0xFFFF:
+            self.input_runs[-1][0] += 1
+        else:
+            self.input_runs.append([1, bits])
+    
+    def add_command(self, tick: int, command: int, type_index: int = 0, grid_x: int = 0, grid_y: int = 0):
+        """Append a command issued before the given tick"""
+        self.commands.append((tick, command, type_index, grid_x, grid_y))
+    
+    def iter_inputs(self) -> Iterator[PlayerInput]:
+        """Iterate over the recorded player controls in order"""
+        for count, bits in self.input_runs:
+            controls = decode_input(bits)
+            for _ in range(count):
+                yield controls
+    
+    def save(self, path: str):
+        """Write the replay to a binary file"""
+        with open(path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.VERSION, self.seed, self.sim_hz, self.catalog_digest,
+                                     self.ticks, len(self.input_runs), len(self.commands)))
+            for count, bits in self.input_runs:
+                f.write(self.RUN.pack(count, bits))
+            for command in self.commands:
+                f.write(self.COMMAND.pack(*command))
+    
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        """Read a replay written by save; raises ValueError if it cannot be played here"""
+        with open(path, "rb") as f:
+            data = f.read()
+        
+        try:
+            (magic, version, seed, sim_hz, catalog_digest,
+             ticks, num_runs, num_commands) = cls.HEADER.unpack_from(data)
+            if magic != cls.MAGIC or version != cls.VERSION:
+                raise ValueError(f"{path} is not a version {cls.VERSION} replay file")
+            
+            replay = cls(seed, sim_hz, catalog_digest)
+            replay.ticks = ticks
+            offset = cls.HEADER.size
+            for _ in range(num_runs):
+                replay.input_runs.append(list(cls.RUN.unpack_from(data, offset)))
+                offset += cls.RUN.size
+            for _ in range(num_commands):
+                replay.commands.append(cls.COMMAND.unpack_from(data, offset))
+                offset += cls.COMMAND.size
+        except struct.error as e:
+            raise ValueError(f"{path}: corrupt replay data: {e}") from e
+        
+        if sim_hz != SIM_HZ:
+            raise ValueError(f"{path} was recorded at {sim_hz} Hz, the simulation runs at {SIM_HZ} Hz")
+        if catalog_digest != get_catalog().digest:
+            raise ValueError(f"{path} was recorded with a different component catalog")
+        return replay
+
+class ReplayPlayer:
+    """Feeds a replay's inputs and commands back to the game tick by tick"""
+    
+    def __init__(self, replay: Replay):
+        self.replay = replay
+        self._inputs = replay.iter_inputs()
+        self._next_command = 0
+    
+    def commands_for(self, tick: int) -> List[Command]:
+        """Get the commands issued before a tick (call once per tick, in order)"""
+        commands = self.replay.commands
+        start = self._next_command
+        while self._next_command < len(commands) and commands[self._next_command][0] <= tick:
+            self._next_command += 1
+        return commands[start:self._next_command]
+    
+    def next_input(self) -> PlayerInput:
+        """Get the next recorded player controls (no input once exhausted)"""
+        return next(self._inputs, PlayerInput())
+    
+    def finished(self, tick: int) -> bool:
+        """Whether the game has reached the end of the recording"""
+        return tick >= self.replay.ticks
@@ -0,0 +1,29 @@
+"""Seeded random number streams for reproducible games"""
+import random
+from typing import Optional
+
+class RandomStreams:
+    """Independent random generators per subsystem, all derived from one seed.
+    
+    Gameplay draws from ``spawn`` (enemy placement) and ``ai`` (AI decisions);
+    ``cosmetic`` feeds particles and the starfield, so visual effects can be
+    switched off or changed without altering the course of a battle.
+    """
+    
+    STREAMS = ("spawn", "ai", "cosmetic")
+    
+    def __init__(self, seed: Optional[int] = None):
+        self.spawn = random.Random()
+        self.ai = random.Random()
+        self.cosmetic = random.Random()
+        self.reseed(seed)
+    
+    def reseed(self, seed: Optional[int] = None):
+        """Restart every stream from a seed (a fresh random one if None).
+        
+        The generators are reseeded in place, so references handed out to
+        subsystems stay valid.
+        """
+        self.seed = random.getrandbits(32) if seed is None else seed
+        for name in self.STREAMS:
+            getattr(self, name).seed(f"{self.seed}:{name}")
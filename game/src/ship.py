@@ -2,15 +2,117 @@
 import pygame
 import math
 import random
-from typing import List, Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
 from .components import Component, ComponentType
-from .projectile import Projectile
-from .config import GRID_SIZE, MAX_VELOCITY, DRAG
+from .projectile import ProjectilePool
+from .config import GRID_SIZE, MAX_VELOCITY, DRAG, REFERENCE_DT
+
+# A ship design: (component_type, grid_x, grid_y) for every component
+Layout = List[Tuple[str, int, int]]
+
+# Default player ship
+PLAYER_LAYOUT: Layout = [
+    # Core in center
+    (ComponentType.CORE, 4, 4),
+    # Engines
+    (ComponentType.ENGINE, 4, 6),
+    (ComponentType.ENGINE, 4, 7),
+    # Weapons
+    (ComponentType.WEAPON_LASER, 3, 3),
+    (ComponentType.WEAPON_LASER, 5, 3),
+    (ComponentType.WEAPON_CANNON, 4, 2),
+    # Power
+    (ComponentType.POWER, 3, 5),
+    (ComponentType.POWER, 5, 5),
+    # Armor
+    (ComponentType.ARMOR, 3, 4),
+    (ComponentType.ARMOR, 5, 4),
+    (ComponentType.ARMOR, 4, 5),
+]
+
+# Default enemy ship: smaller and simpler
+ENEMY_LAYOUT: Layout = [
+    (ComponentType.CORE, 4, 4),
+    (ComponentType.ENGINE, 4, 6),
+    (ComponentType.WEAPON_LASER, 4, 3),
+    (ComponentType.POWER, 3, 4),
+    (ComponentType.ARMOR, 5, 4),
+]
+
+class RotationCache:
+    """LRU cache of rotated sprites keyed by (sprite, angle step), under one byte budget.
+    
+    Every ShipSprite shares the same cache, so memory stays bounded however
+    many ships (and damaged variants) are on screen. Rotations of sprites
+    that are no longer used simply age out.
+    """
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[Tuple[ShipSprite, int], pygame.Surface]" = OrderedDict()
+        self.bytes = 0
+    
+    def get(self, sprite: "ShipSprite", step: int) -> pygame.Surface:
+        """Get a sprite rotated to a quantized angle step, rotating it on a miss"""
+        key = (sprite, step)
+        rotated = self.entries.get(key)
+        if rotated is not None:
+            self.entries.move_to_end(key)
+            return rotated
+        
+        degrees = step * 360.0 / Ship.ROTATION_STEPS
+        rotated = pygame.transform.rotate(sprite.surface, -degrees)
+        self.entries[key] = rotated
+        self.bytes += rotated.get_width() * rotated.get_height() * rotated.get_bytesize()
+        
+        # Evict least recently used rotations, always keeping the newest
+        while self.bytes > self.max_bytes and len(self.entries) > 1:
+            _, old = self.entries.popitem(last=False)
+            self.bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+        
+        return rotated
+    
+    def clear(self):
+        """Drop all rotated sprites"""
+        self.entries.clear()
+        self.bytes = 0
+
+class ShipSprite:
+    """A ship's composed sprite; its rotated variants live in the shared ROTATION_CACHE.
+    
+    Ships cloned from the same prototype share one until their appearance
+    changes, so they also share the rotation work.
+    """
+    
+    def __init__(self, surface: pygame.Surface, offset: Tuple[float, float]):
+        self.surface = surface
+        self.offset = offset  # Sprite centre relative to the ship's rotation centre
+    
+    def rotated(self, step: int) -> pygame.Surface:
+        """Get the sprite rotated to a quantized angle step (LRU cached)"""
+        return ROTATION_CACHE.get(self, step)
 
 class Ship:
     """A spaceship made of modular components"""
     
-    def __init__(self, x: float, y: float, ship_id: int, is_player: bool = False):
+    # Sprite cache settings: rotations are quantized to ROTATION_STEPS angles
+    # and all ships together keep at most ROTATION_CACHE_BYTES of rotated
+    # variants (see ROTATION_CACHE)
+    ROTATION_STEPS = 128
+    ROTATION_CACHE_BYTES = 32 * 1024 * 1024
+    
+    # Debug: verify incrementally maintained stats against a full recompute
+    DEBUG_CHECK_STATS = False
+    
+    # AI steering: turn rate limit, turn rate per radian of heading error,
+    # and the range AI ships close to before they stop thrusting
+    AI_ROTATION_SPEED = 2.0
+    AI_TURN_GAIN = 4.0
+    AI_OPTIMAL_DISTANCE = 300
+    
+    def __init__(self, x: float, y: float, ship_id: int, is_player: bool = False,
+                 layout: Optional[Layout] = None):
         self.x = x
         self.y = y
         self.ship_id = ship_id
@@ -20,61 +122,96 @@ class Ship:
         self.vy = 0  # Velocity Y
         self.angular_velocity = 0
         
+        # Position and angle at the start of the last update, for render interpolation
+        self.prev_x = x
+        self.prev_y = y
+        self.prev_angle = 0.0
+        
         # Ship components organized in a grid
         self.components: List[Component] = []
         self.grid_width = 10
         self.grid_height = 10
         
-        # Ship stats (calculated from components)
+        # Occupancy index: grid cell -> component, plus the live cores
+        self._grid: Dict[Tuple[int, int], Component] = {}
+        self._cores: Set[Component] = set()
+        
+        # Incremented whenever a component is added or removed
+        self.layout_version = 0
+        
+        # Cached (min_x, min_y, max_x, max_y) of occupied cells and bounding radius
+        self._extent: Optional[Tuple[int, int, int, int]] = None
+        self._radius: Optional[float] = None
+        
+        # Ship stats (maintained incrementally as components change)
         self.total_health = 0
         self.max_health = 0
         self.power_available = 0
         self.power_used = 0
         self.total_thrust = 0
+        self._stats_dirty = False
         
         # AI properties
+        self.ai_controlled = not is_player
         self.target: Optional['Ship'] = None
         self.ai_state = "idle"
         
-        # Create default ship layout
-        if is_player:
-            self._create_player_ship()
-        else:
-            self._create_enemy_ship()
+        # Latest AI decision, steered towards every update until the next one
+        self.ai_heading: Optional[float] = None  # None while there is nothing to steer to
+        self.ai_thrust = False
         
-        self._recalculate_stats()
+        # Render cache: composed sprite plus rotated variants by angle step
+        self._sprite: Optional[ShipSprite] = None
+        
+        # Create the given or the default ship layout
+        if layout is None:
+            layout = PLAYER_LAYOUT if is_player else ENEMY_LAYOUT
+        self._build_layout(layout)
+    
+    def _build_layout(self, layout: Layout):
+        """Create components from a layout of (component_type, grid_x, grid_y)"""
+        for component_type, grid_x, grid_y in layout:
+            self._attach_component(Component(component_type, grid_x, grid_y))
+    
+    def clone(self, x: float, y: float, ship_id: int, is_player: bool = False) -> "Ship":
+        """Create a ship with copies of this ship's components at a new position.
+        
+        Stats, extent and radius are copied rather than recomputed, and the
+        sprite (if built) is shared until either ship's appearance changes.
+        """
+        ship = Ship(x, y, ship_id, is_player, layout=())
+        ship.grid_width = self.grid_width
+        ship.grid_height = self.grid_height
+        cores = self._cores
+        grid = ship._grid
+        for comp in self.components:
+            copy = comp.copy()
+            grid[(copy.grid_x, copy.grid_y)] = copy
+            if comp in cores:
+                ship._cores.add(copy)
+        ship.components = list(grid.values())
+        
+        ship.total_health = self.total_health
+        ship.max_health = self.max_health
+        ship.power_available = self.power_available
+        ship.power_used = self.power_used
+        ship.total_thrust = self.total_thrust
+        ship._stats_dirty = self._stats_dirty
+        if self.components:
+            ship._extent = self.get_extent()
+            ship._radius = self.get_radius()
+        ship.layout_version = self.layout_version
+        ship._sprite = self._sprite
+        return ship
+    
+    def build_sprite(self):
+        """Compose the sprite now instead of on the first render (e.g. before cloning)"""
+        if self._sprite is None and self.components:
+            self._sprite = self._build_sprite()
     
-    def _create_player_ship(self):
-        """Create default player ship"""
-        # Core in center
-        self.components.append(Component(ComponentType.CORE, 4, 4))
-        
-        # Engines
-        self.components.append(Component(ComponentType.ENGINE, 4, 6))
-        self.components.append(Component(ComponentType.ENGINE, 4, 7))
-        
-        # Weapons
-        self.components.append(Component(ComponentType.WEAPON_LASER, 3, 3))
-        self.components.append(Component(ComponentType.WEAPON_LASER, 5, 3))
-        self.components.append(Component(ComponentType.WEAPON_CANNON, 4, 2))
-        
-        # Power
-        self.components.append(Component(ComponentType.POWER, 3, 5))
-        self.components.append(Component(ComponentType.POWER, 5, 5))
-        
-        # Armor
-        self.components.append(Component(ComponentType.ARMOR, 3, 4))
-        self.components.append(Component(ComponentType.ARMOR, 5, 4))
-        self.components.append(Component(ComponentType.ARMOR, 4, 5))
-    
-    def _create_enemy_ship(self):
-        """Create default enemy ship"""
-        # Smaller, simpler enemy ship
-        self.components.append(Component(ComponentType.CORE, 4, 4))
-        self.components.append(Component(ComponentType.ENGINE, 4, 6))
-        self.components.append(Component(ComponentType.WEAPON_LASER, 4, 3))
-        self.components.append(Component(ComponentType.POWER, 3, 4))
-        self.components.append(Component(ComponentType.ARMOR, 5, 4))
+    def get_layout(self) -> Layout:
+        """Get the current components as a layout"""
+        return [(c.component_type, c.grid_x, c.grid_y) for c in self.components]
     
     def _recalculate_stats(self):
         """Recalculate ship stats from components"""
@@ -85,45 +222,131 @@ class Ship:
         self.total_thrust = 0
         
         for comp in self.components:
-            self.total_health += comp.stats.health
+            self.total_health += comp.health
             self.max_health += comp.stats.max_health
             self.power_available += comp.stats.power_generation
             self.power_used += comp.stats.power_consumption
             self.total_thrust += comp.stats.thrust
+        
+        self._stats_dirty = False
     
-    def add_component(self, component: Component):
-        """Add a component to the ship"""
-        self.components.append(component)
+    def _apply_component_stats(self, comp: Component, sign: int):
+        """Add (sign=1) or subtract (sign=-1) a component's contribution to ship stats"""
+        self.total_health += sign * comp.health
+        self.max_health += sign * comp.stats.max_health
+        self.power_available += sign * comp.stats.power_generation
+        self.power_used += sign * comp.stats.power_consumption
+        self.total_thrust += sign * comp.stats.thrust
+    
+    def mark_stats_dirty(self):
+        """Request a full stats rebuild on the next update.
+        
+        Call this after changing component stats directly instead of
+        through add_component/remove_component/take_damage.
+        """
+        self._stats_dirty = True
+    
+    def _check_stats(self):
+        """Assert that the incremental stats match a full recompute"""
+        expected = (self.total_health, self.max_health, self.power_available,
+                    self.power_used, self.total_thrust)
         self._recalculate_stats()
+        actual = (self.total_health, self.max_health, self.power_available,
+                  self.power_used, self.total_thrust)
+        assert all(math.isclose(e, a, abs_tol=1e-6) for e, a in zip(expected, actual)), \
+            f"Ship {self.ship_id} stats drifted: incremental {expected} != recomputed {actual}"
+    
+    def _attach_component(self, component: Component):
+        """Add a component to the component list and occupancy index"""
+        occupant = self._grid.get((component.grid_x, component.grid_y))
+        if occupant is not None:
+            self._detach_component(occupant)
+        
+        self.components.append(component)
+        self._grid[(component.grid_x, component.grid_y)] = component
+        if component.component_type == ComponentType.CORE:
+            self._cores.add(component)
+        self._apply_component_stats(component, 1)
+        self._extent = None
+        self._radius = None
+        self.layout_version += 1
+    
+    def _detach_component(self, component: Component):
+        """Remove a component from the component list and occupancy index"""
+        self.components.remove(component)
+        del self._grid[(component.grid_x, component.grid_y)]
+        self._cores.discard(component)
+        self._apply_component_stats(component, -1)
+        self._extent = None
+        self._radius = None
+        self.layout_version += 1
+    
+    def add_component(self, component: Component):
+        """Add a component to the ship, replacing any component in its cell"""
+        self._attach_component(component)
+        self._invalidate_sprite()
     
     def remove_component(self, grid_x: int, grid_y: int):
         """Remove component at grid position"""
-        self.components = [c for c in self.components 
-                          if not (c.grid_x == grid_x and c.grid_y == grid_y)]
-        self._recalculate_stats()
+        comp = self._grid.get((grid_x, grid_y))
+        if comp is not None:
+            self._detach_component(comp)
+            self._invalidate_sprite()
     
     def get_component_at(self, grid_x: int, grid_y: int) -> Optional[Component]:
         """Get component at grid position"""
-        for comp in self.components:
-            if comp.grid_x == grid_x and comp.grid_y == grid_y:
-                return comp
-        return None
+        return self._grid.get((grid_x, grid_y))
+    
+    def get_extent(self) -> Tuple[int, int, int, int]:
+        """Get (min_x, min_y, max_x, max_y) of the occupied grid cells"""
+        if self._extent is None:
+            self._extent = (
+                min(c.grid_x for c in self.components),
+                min(c.grid_y for c in self.components),
+                max(c.grid_x for c in self.components),
+                max(c.grid_y for c in self.components),
+            )
+        return self._extent
+    
+    def save_previous_state(self):
+        """Remember the current position and angle as the interpolation start"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.prev_angle = self.angle
+    
+    def get_interpolated_state(self, alpha: float) -> Tuple[float, float, float]:
+        """Get (x, y, angle) blended from the previous to the current update"""
+        # Blend the angle along the shorter arc
+        angle_diff = (self.angle - self.prev_angle + math.pi) % (2 * math.pi) - math.pi
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha,
+                self.prev_angle + angle_diff * alpha)
     
     def update(self, dt: float, target: Optional['Ship'] = None):
         """Update ship physics and components"""
-        # Update all components
-        for comp in self.components:
-            comp.update(dt)
+        self.save_previous_state()
+        self.update_components(dt)
         
         # AI control
-        if not self.is_player and target:
-            self.target = target
-            self._update_ai(dt)
+        if target is not None:
+            self.update_ai(dt, target)
         
-        # Apply drag
-        self.vx *= DRAG
-        self.vy *= DRAG
-        self.angular_velocity *= DRAG
+        self.integrate(dt)
+        self.check_stats()
+    
+    def update_components(self, dt: float):
+        """Update all components (counting down weapon cooldowns)"""
+        for comp in self.components:
+            if comp.cooldown > 0:
+                comp.cooldown -= dt
+    
+    def integrate(self, dt: float):
+        """Apply drag and the speed limit, then move and turn"""
+        # Apply drag, scaled to the step length
+        drag = DRAG ** (dt / REFERENCE_DT)
+        self.vx *= drag
+        self.vy *= drag
+        self.angular_velocity *= drag
         
         # Limit velocity
         speed = math.sqrt(self.vx**2 + self.vy**2)
@@ -138,46 +361,55 @@ class Ship:
         
         # Keep angle in range
         self.angle = self.angle % (2 * math.pi)
-        
-        # Recalculate stats
-        self._recalculate_stats()
     
-    def _update_ai(self, dt: float):
-        """Simple AI behavior"""
-        if not self.target:
+    def check_stats(self):
+        """Rebuild stats if something bypassed the incremental updates (or verify them when debugging)"""
+        if self._stats_dirty:
+            self._recalculate_stats()
+        elif self.DEBUG_CHECK_STATS:
+            self._check_stats()
+    
+    def update_ai(self, dt: float, target: Optional['Ship']):
+        """Decide and steer towards a target right away if the ship is AI-controlled.
+        
+        The game schedules decisions through AIScheduler instead; this is for
+        driving a single ship directly.
+        """
+        if self.ai_controlled and target:
+            self.ai_decide(target)
+            self.ai_steer(dt)
+    
+    def ai_decide(self, target: Optional['Ship']):
+        """Choose the heading to turn to and whether to thrust, towards a target"""
+        self.target = target
+        self.ai_heading = None
+        self.ai_thrust = False
+        if not target:
             return
         
-        # Calculate direction to target
-        dx = self.target.x - self.x
-        dy = self.target.y - self.y
-        distance = math.sqrt(dx**2 + dy**2)
-        
+        dx = target.x - self.x
+        dy = target.y - self.y
+        distance = math.hypot(dx, dy)
         if distance < 10:
             return
         
-        target_angle = math.atan2(dy, dx)
-        
-        # Rotate towards target
-        angle_diff = target_angle - self.angle
-        # Normalize angle difference to [-pi, pi]
-        while angle_diff > math.pi:
-            angle_diff -= 2 * math.pi
-        while angle_diff < -math.pi:
-            angle_diff += 2 * math.pi
-        
-        # Apply rotation
-        rotation_speed = 2.0
-        if abs(angle_diff) > 0.1:
-            self.angular_velocity = rotation_speed * (1 if angle_diff > 0 else -1)
-        else:
-            self.angular_velocity = 0
-        
-        # Move forward if facing target
-        if abs(angle_diff) < 0.5:
-            # Keep distance
-            optimal_distance = 300
-            if distance > optimal_distance:
-                self.apply_thrust(dt)
+        self.ai_heading = math.atan2(dy, dx)
+        self.ai_thrust = distance > self.AI_OPTIMAL_DISTANCE
+    
+    def ai_steer(self, dt: float):
+        """Turn towards the decided heading, and thrust once roughly facing it"""
+        if self.ai_heading is None:
+            return
+        
+        # Heading error in [-pi, pi]
+        angle_diff = math.remainder(self.ai_heading - self.angle, 2 * math.pi)
+        
+        # Turn rate proportional to the error, so ships settle instead of oscillating
+        turn = self.AI_TURN_GAIN * angle_diff
+        self.angular_velocity = max(-self.AI_ROTATION_SPEED, min(self.AI_ROTATION_SPEED, turn))
+        
+        if self.ai_thrust and abs(angle_diff) < 0.5:
+            self.apply_thrust(dt)
     
     def apply_thrust(self, dt: float):
         """Apply thrust in the direction the ship is facing"""
@@ -191,8 +423,11 @@ class Ship:
         rotation_speed = 3.0
         self.angular_velocity += direction * rotation_speed * dt
     
-    def fire_weapons(self) -> List[Projectile]:
-        """Fire all weapons that can fire. Returns list of projectiles."""
+    def fire_weapons(self, pool: ProjectilePool) -> List[int]:
+        """Fire all weapons that can fire into a projectile pool.
+        
+        Returns the pool slot indices of the new projectiles.
+        """
         projectiles = []
         
         for comp in self.components:
@@ -211,93 +446,173 @@ class Ship:
                 spawn_y = self.y + rotated_y
                 
                 # Create projectile
-                proj_type = "laser" if comp.component_type == ComponentType.WEAPON_LASER else "cannon"
-                damage = 10 if proj_type == "laser" else 25
-                speed = 500 if proj_type == "laser" else 350
-                
-                projectile = Projectile(
+                stats = comp.stats
+                slot = pool.spawn(
                     spawn_x, spawn_y, 
                     self.angle,
-                    speed, damage, proj_type, 
+                    stats.speed, stats.damage, stats.projectile_id, 
                     self.ship_id
                 )
-                projectiles.append(projectile)
+                if slot >= 0:
+                    projectiles.append(slot)
         
         return projectiles
     
-    def take_damage(self, damage: int, hit_x: float, hit_y: float):
-        """Apply damage to the ship at a specific world position"""
-        # Convert world position to local grid position
-        local_x = hit_x - self.x
-        local_y = hit_y - self.y
-        
-        # Rotate by inverse of ship angle
-        angle = -self.angle
-        rotated_x = local_x * math.cos(angle) - local_y * math.sin(angle)
-        rotated_y = local_x * math.sin(angle) + local_y * math.cos(angle)
-        
-        # Convert to grid coordinates
-        grid_x = int((rotated_x / GRID_SIZE) + self.grid_width // 2)
-        grid_y = int((rotated_y / GRID_SIZE) + self.grid_height // 2)
-        
-        # Find component at position
-        comp = self.get_component_at(grid_x, grid_y)
-        if comp:
-            destroyed = comp.take_damage(damage)
-            if destroyed:
-                self.components.remove(comp)
+    def take_damage(self, damage: int, comp: Component) -> int:
+        """Apply damage to one of the ship's components. Returns the health lost."""
+        bucket = comp.damage_bucket()
+        health = comp.health
+        destroyed = comp.take_damage(damage)
+        lost = health - comp.health
+        self.total_health -= lost
+        if destroyed:
+            self._detach_component(comp)
+            self._invalidate_sprite()
+        elif comp.damage_bucket() != bucket:
+            self._invalidate_sprite()
+        return lost
+    
+    def raycast(self, x0: float, y0: float, x1: float, y1: float) -> Optional[Tuple[float, Component]]:
+        """Find the first component hit by a world-space segment.
+        
+        The segment is transformed into ship-local grid space once and the
+        occupied cells are walked with a DDA grid traversal. Returns
+        (t, component) where t in [0, 1] is the position of the hit along
+        the segment, or None if nothing is hit.
+        """
+        if not self.components:
+            return None
+        
+        # Rotate into ship-local space and scale to grid cell units
+        cos_a = math.cos(self.angle)
+        sin_a = math.sin(self.angle)
+        offset_x = self.grid_width // 2
+        offset_y = self.grid_height // 2
+        dx0 = x0 - self.x
+        dy0 = y0 - self.y
+        dx1 = x1 - self.x
+        dy1 = y1 - self.y
+        u0 = (dx0 * cos_a + dy0 * sin_a) / GRID_SIZE + offset_x
+        v0 = (-dx0 * sin_a + dy0 * cos_a) / GRID_SIZE + offset_y
+        du = (dx1 * cos_a + dy1 * sin_a) / GRID_SIZE + offset_x - u0
+        dv = (-dx1 * sin_a + dy1 * cos_a) / GRID_SIZE + offset_y - v0
+        
+        # Clip the segment to the occupied extent
+        min_x, min_y, max_x, max_y = self.get_extent()
+        t_enter, t_exit = 0.0, 1.0
+        for start, delta, low, high in ((u0, du, min_x, max_x + 1), (v0, dv, min_y, max_y + 1)):
+            if delta == 0:
+                if not low <= start < high:
+                    return None
+                continue
+            t_a = (low - start) / delta
+            t_b = (high - start) / delta
+            if t_a > t_b:
+                t_a, t_b = t_b, t_a
+            t_enter = max(t_enter, t_a)
+            t_exit = min(t_exit, t_b)
+            if t_enter > t_exit:
+                return None
+        
+        # Starting cell, clamped against rounding at the extent edge
+        cell_x = min(max(math.floor(u0 + du * t_enter), min_x), max_x)
+        cell_y = min(max(math.floor(v0 + dv * t_enter), min_y), max_y)
+        
+        step_x = 1 if du > 0 else -1
+        step_y = 1 if dv > 0 else -1
+        delta_tx = abs(1 / du) if du else math.inf
+        delta_ty = abs(1 / dv) if dv else math.inf
+        next_tx = (cell_x + (step_x > 0) - u0) / du if du else math.inf
+        next_ty = (cell_y + (step_y > 0) - v0) / dv if dv else math.inf
+        
+        t = t_enter
+        while t <= t_exit:
+            comp = self._grid.get((cell_x, cell_y))
+            if comp is not None:
+                return t, comp
+            
+            if next_tx < next_ty:
+                t = next_tx
+                next_tx += delta_tx
+                cell_x += step_x
+            else:
+                t = next_ty
+                next_ty += delta_ty
+                cell_y += step_y
         
-        self._recalculate_stats()
+        return None
     
     def is_destroyed(self) -> bool:
         """Check if ship is destroyed (no core)"""
-        for comp in self.components:
-            if comp.component_type == ComponentType.CORE:
-                return False
-        return True
+        return not self._cores
+    
+    def get_radius(self) -> float:
+        """Distance from the rotation centre to the farthest occupied cell corner"""
+        if not self.components:
+            return 0.0
+        
+        if self._radius is None:
+            min_x, min_y, max_x, max_y = self.get_extent()
+            far_x = max(abs(min_x - self.grid_width // 2), abs(max_x + 1 - self.grid_width // 2))
+            far_y = max(abs(min_y - self.grid_height // 2), abs(max_y + 1 - self.grid_height // 2))
+            self._radius = math.hypot(far_x, far_y) * GRID_SIZE
+        return self._radius
     
     def get_bounds(self) -> pygame.Rect:
-        """Get bounding rectangle in world space"""
+        """Get a world-space rectangle that contains the ship at any rotation"""
         if not self.components:
             return pygame.Rect(self.x, self.y, 1, 1)
         
-        min_x = min(c.grid_x for c in self.components)
-        max_x = max(c.grid_x for c in self.components)
-        min_y = min(c.grid_y for c in self.components)
-        max_y = max(c.grid_y for c in self.components)
+        radius = math.ceil(self.get_radius())
+        return pygame.Rect(int(self.x) - radius, int(self.y) - radius,
+                           radius * 2 + 1, radius * 2 + 1)
+    
+    def _invalidate_sprite(self):
+        """Drop cached sprites after the component layout or damage shading changed"""
+        self._sprite = None
+    
+    def _build_sprite(self) -> ShipSprite:
+        """Compose all components into one sprite cropped to the occupied cells"""
+        min_x, min_y, max_x, max_y = self.get_extent()
         
         width = (max_x - min_x + 1) * GRID_SIZE
         height = (max_y - min_y + 1) * GRID_SIZE
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
         
-        # Approximate center position
-        center_offset_x = (min_x + max_x) / 2 - self.grid_width // 2
-        center_offset_y = (min_y + max_y) / 2 - self.grid_height // 2
-        
-        return pygame.Rect(
-            self.x + center_offset_x * GRID_SIZE - width // 2,
-            self.y + center_offset_y * GRID_SIZE - height // 2,
-            width, height
+        for comp in self.components:
+            comp_x = (comp.grid_x - min_x) * GRID_SIZE
+            comp_y = (comp.grid_y - min_y) * GRID_SIZE
+            comp.render(surface, comp_x, comp_y, GRID_SIZE)
+        
+        # Offset of the sprite centre from the ship's rotation centre
+        offset = (
+            min_x * GRID_SIZE + width / 2 - self.grid_width * GRID_SIZE / 2,
+            min_y * GRID_SIZE + height / 2 - self.grid_height * GRID_SIZE / 2,
         )
+        return ShipSprite(surface, offset)
     
-    def render(self, surface: pygame.Surface, camera_x: float, camera_y: float):
-        """Render the ship"""
-        screen_x = int(self.x - camera_x)
-        screen_y = int(self.y - camera_y)
+    def render(self, surface: pygame.Surface, camera_x: float, camera_y: float, alpha: float = 1.0):
+        """Render the ship, interpolated by alpha between its last two updates"""
+        x, y, ship_angle = self.get_interpolated_state(alpha)
+        screen_x = int(x - camera_x)
+        screen_y = int(y - camera_y)
         
-        # Create a temporary surface for the ship
-        ship_width = self.grid_width * GRID_SIZE
-        ship_height = self.grid_height * GRID_SIZE
-        ship_surface = pygame.Surface((ship_width, ship_height), pygame.SRCALPHA)
+        if not self.components:
+            return
         
-        # Render components on temporary surface
-        for comp in self.components:
-            comp_x = comp.grid_x * GRID_SIZE
-            comp_y = comp.grid_y * GRID_SIZE
-            comp.render(ship_surface, comp_x, comp_y, GRID_SIZE)
+        if self._sprite is None:
+            self._sprite = self._build_sprite()
         
-        # Rotate the ship surface
-        rotated = pygame.transform.rotate(ship_surface, -math.degrees(self.angle))
-        rotated_rect = rotated.get_rect(center=(screen_x, screen_y))
+        # Quantize rotation so rotated sprites can be reused
+        step = round(ship_angle * self.ROTATION_STEPS / (2 * math.pi)) % self.ROTATION_STEPS
+        rotated = self._sprite.rotated(step)
+        
+        # Rotate the sprite's centre offset by the same quantized angle
+        angle = step * 2 * math.pi / self.ROTATION_STEPS
+        offset_x, offset_y = self._sprite.offset
+        center_x = screen_x + offset_x * math.cos(angle) - offset_y * math.sin(angle)
+        center_y = screen_y + offset_x * math.sin(angle) + offset_y * math.cos(angle)
+        rotated_rect = rotated.get_rect(center=(round(center_x), round(center_y)))
         
         # Draw on main surface
         surface.blit(rotated, rotated_rect.topleft)
@@ -308,3 +623,6 @@ class Ship:
             pygame.draw.line(surface, (0, 255, 0),
                            (screen_x, screen_y),
                            (screen_x + self.vx * vel_scale, screen_y + self.vy * vel_scale), 2)
+
+# Rotated sprites of every ship, within Ship.ROTATION_CACHE_BYTES in total
+ROTATION_CACHE = RotationCache(Ship.ROTATION_CACHE_BYTES)
@@ -0,0 +1,126 @@
+"""Uniform-grid spatial hash for broadphase collision queries"""
+import pygame
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
+
+CellRange = Tuple[int, int, int, int]
+
+class SpatialHash:
+    """Buckets items by the grid cells their bounding rectangles overlap.
+    
+    Items are either inserted for one query pass and dropped with clear(),
+    or kept between passes with update() and remove(), which only re-bucket
+    an item when the range of cells it covers changes.
+    """
+    
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Any]] = {}
+        self._ranges: Dict[Any, CellRange] = {}  # Cells covered by each updated item
+        self._occupied: Optional[np.ndarray] = None  # Sorted packed keys of self.cells
+    
+    def clear(self):
+        """Remove all items"""
+        self.cells.clear()
+        self._ranges.clear()
+        self._occupied = None
+    
+    def _cell_range(self, rect: pygame.Rect) -> CellRange:
+        """Get the inclusive cell range covered by a rectangle"""
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                (rect.right - 1) // size, (rect.bottom - 1) // size)
+    
+    def insert(self, item: Any, rect: pygame.Rect):
+        """Insert an item into every cell its rectangle overlaps"""
+        self._add(item, self._cell_range(rect))
+    
+    def update(self, item: Any, rect: pygame.Rect):
+        """Insert an item, or move it to a new rectangle if it covers different cells"""
+        cell_range = self._cell_range(rect)
+        old_range = self._ranges.get(item)
+        if old_range == cell_range:
+            return
+        if old_range is not None:
+            self._discard(item, old_range)
+        self._ranges[item] = cell_range
+        self._add(item, cell_range)
+    
+    def remove(self, item: Any):
+        """Remove an item added with update()"""
+        old_range = self._ranges.pop(item, None)
+        if old_range is not None:
+            self._discard(item, old_range)
+    
+    def _add(self, item: Any, cell_range: CellRange):
+        """Append an item to the buckets of a cell range"""
+        min_cx, min_cy, max_cx, max_cy = cell_range
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket is None:
+                    self.cells[(cx, cy)] = [item]
+                    self._occupied = None
+                else:
+                    bucket.append(item)
+    
+    def _discard(self, item: Any, cell_range: CellRange):
+        """Take an item out of the buckets of a cell range, dropping emptied cells"""
+        min_cx, min_cy, max_cx, max_cy = cell_range
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = self.cells[(cx, cy)]
+                bucket.remove(item)
+                if not bucket:
+                    del self.cells[(cx, cy)]
+                    self._occupied = None
+    
+    def query_rect(self, rect: pygame.Rect) -> List[Any]:
+        """Get the distinct items stored in the cells a rectangle overlaps"""
+        min_cx, min_cy, max_cx, max_cy = self._cell_range(rect)
+        if min_cx == max_cx and min_cy == max_cy:
+            return self.cells.get((min_cx, min_cy), [])
+        
+        found = []
+        seen = set()
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                for item in self.cells.get((cx, cy), ()):
+                    if id(item) not in seen:
+                        seen.add(id(item))
+                        found.append(item)
+        return found
+    
+    def overlaps_mask(self, left: np.ndarray, top: np.ndarray,
+                      right: np.ndarray, bottom: np.ndarray) -> np.ndarray:
+        """Vectorized prefilter: which rectangles may touch an occupied cell.
+        
+        Exact for rectangles spanning at most two cells per axis; larger
+        rectangles are always reported as candidates.
+        """
+        if not self.cells:
+            return np.zeros(len(left), dtype=bool)
+        
+        occupied = self._occupied
+        if occupied is None:
+            occupied = self._occupied = np.sort(np.array([self._pack(cx, cy) for cx, cy in self.cells],
+                                                         dtype=np.int64))
+        size = self.cell_size
+        min_cx = np.floor(left / size).astype(np.int64)
+        min_cy = np.floor(top / size).astype(np.int64)
+        max_cx = np.floor(right / size).astype(np.int64)
+        max_cy = np.floor(bottom / size).astype(np.int64)
+        
+        # Look up all four corner cells with one sorted search
+        corners = np.concatenate([self._pack(min_cx, min_cy), self._pack(max_cx, min_cy),
+                                  self._pack(min_cx, max_cy), self._pack(max_cx, max_cy)])
+        found = occupied[np.minimum(np.searchsorted(occupied, corners), len(occupied) - 1)] == corners
+        
+        mask = found.reshape(4, -1).any(axis=0)
+        mask |= (max_cx - min_cx > 1) | (max_cy - min_cy > 1)
+        return mask
+    
+    @staticmethod
+    def _pack(cx, cy):
+        """Pack cell coordinates (scalars or arrays) into one integer key"""
+        return (cx << 32) + (cy + (1 << 31))
@@ -2,18 +2,23 @@
 import pygame
 import random
 import math
-from typing import List, Tuple
-from .config import SCREEN_WIDTH, SCREEN_HEIGHT
+import numpy as np
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from .config import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK
 
 class Star:
     """A single star in the starfield"""
-    def __init__(self, x: float, y: float, size: float, brightness: int, depth: float):
+    def __init__(self, x: float, y: float, size: float, brightness: int, depth: float,
+                 twinkle_offset: Optional[float] = None):
         self.x = x
         self.y = y
         self.size = size
         self.brightness = brightness
         self.depth = depth  # 0.0-1.0, lower = farther away
-        self.twinkle_offset = random.random() * math.pi * 2  # Random phase for twinkling
+        if twinkle_offset is None:
+            twinkle_offset = random.random() * math.pi * 2  # Random phase for twinkling
+        self.twinkle_offset = twinkle_offset
 
 class Starfield:
     """Enhanced starfield with parallax scrolling"""
@@ -23,12 +28,31 @@ class Starfield:
     TWINKLE_AMPLITUDE = 0.2
     TWINKLE_BASE = 0.8
     
-    def __init__(self):
-        # Multiple layers for parallax effect
-        self.layers: List[List[Star]] = []
+    # Star chunks are 8-bit surfaces whose palette index encodes
+    # (twinkle phase, brightness level); twinkling is a palette update
+    TWINKLE_PHASES = 8
+    BRIGHTNESS_LEVELS = 31
+    
+    # Stars are generated per CHUNK_SIZE square chunk of layer space and
+    # pre-rendered chunks are kept in an LRU of at most CHUNK_CACHE_BYTES
+    CHUNK_SIZE = 512
+    CHUNK_CACHE_BYTES = 32 * 1024 * 1024
+    
+    # Nebula background: parallax factor, nebulae per screen area, and the
+    # resolution scale it is drawn at before being smoothscaled up once
+    NEBULA_PARALLAX = 0.1
+    NEBULA_DENSITY = 20 / 16
+    NEBULA_BAKE_SCALE = 0.5
+    
+    def __init__(self, seed: Optional[int] = None, star_density: float = 1.0):
+        # Chunk and nebula contents are derived from this seed, so the sky
+        # is infinite but always the same for the same seed
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.star_density = star_density
         self.num_layers = 3
         
-        # Layer properties (depth, density, size_range, brightness_range, parallax_factor)
+        # Layer properties (depth, density, size_range, brightness_range, parallax_factor);
+        # density is stars per 3x3 screens at star_density 1.0
         self.layer_configs = [
             # Far layer - small, dim, slow parallax
             (0.2, 150, (1, 1), (80, 120), 0.2),
@@ -41,25 +65,51 @@ class Starfield:
         # Nebula particles for background atmosphere
         self.nebula_particles: List[Tuple[float, float, float, Tuple[int, int, int, int]]] = []
         
-        self._generate_starfield()
+        # The nebula wraps over 2x2 screens
+        self.nebula_width = SCREEN_WIDTH * 2
+        self.nebula_height = SCREEN_HEIGHT * 2
+        
+        # Pre-rendered star chunks by (layer, chunk_x, chunk_y), least recently used first
+        self.chunks: "OrderedDict[Tuple[int, int, int], pygame.Surface]" = OrderedDict()
+        self.chunk_bytes = 0
+        
         self._generate_nebula()
+        
+        # Opaque nebula background
+        self.nebula_tile = self._bake_nebula()
+    
+    def _chunk_rng(self, layer_idx: int, chunk_x: int, chunk_y: int) -> random.Random:
+        """Get a random generator seeded from a hash of (seed, layer, chunk_x, chunk_y)"""
+        h = self.seed
+        for value in (layer_idx, chunk_x, chunk_y):
+            h = ((h ^ (value & 0xFFFFFFFF)) * 0x9E3779B97F4A7C15 + 0x632BE59BD9B4E019) & 0xFFFFFFFFFFFFFFFF
+            h ^= h >> 29
+        return random.Random(h)
     
-    def _generate_starfield(self):
-        """Generate stars for all layers"""
-        for depth, count, size_range, brightness_range, _ in self.layer_configs:
-            layer = []
-            for _ in range(count):
-                x = random.randint(0, SCREEN_WIDTH * 3)
-                y = random.randint(0, SCREEN_HEIGHT * 3)
-                size = random.uniform(*size_range)
-                brightness = random.randint(*brightness_range)
-                star = Star(x, y, size, brightness, depth)
-                layer.append(star)
-            self.layers.append(layer)
+    def _generate_chunk(self, layer_idx: int, chunk_x: int, chunk_y: int) -> List[Star]:
+        """Generate the stars of one chunk, in chunk-local coordinates"""
+        depth, count, size_range, brightness_range, _ = self.layer_configs[layer_idx]
+        rng = self._chunk_rng(layer_idx, chunk_x, chunk_y)
+        
+        # Expected stars per chunk, with the fraction resolved randomly
+        expected = count * self.star_density * self.CHUNK_SIZE ** 2 / (SCREEN_WIDTH * SCREEN_HEIGHT * 9)
+        num_stars = int(expected) + (rng.random() < expected - int(expected))
+        
+        stars = []
+        for _ in range(num_stars):
+            size = rng.uniform(*size_range)
+            # Keep circles inside the chunk so they are never clipped at its edge
+            margin = int(size) if size > 1 else 0
+            x = rng.randint(margin, self.CHUNK_SIZE - 1 - margin)
+            y = rng.randint(margin, self.CHUNK_SIZE - 1 - margin)
+            brightness = rng.randint(*brightness_range)
+            stars.append(Star(x, y, size, brightness, depth, rng.random() * math.pi * 2))
+        return stars
     
     def _generate_nebula(self):
         """Generate nebula particles for atmospheric effect"""
-        num_nebula = 20
+        rng = random.Random(self.seed)
+        num_nebula = round(self.NEBULA_DENSITY * 4)
         colors = [
             (50, 0, 80, 30),    # Purple
             (0, 30, 80, 30),    # Blue
@@ -68,75 +118,127 @@ class Starfield:
         ]
         
         for _ in range(num_nebula):
-            x = random.randint(0, SCREEN_WIDTH * 4)
-            y = random.randint(0, SCREEN_HEIGHT * 4)
-            radius = random.randint(80, 200)
-            color = random.choice(colors)
+            x = rng.randint(0, self.nebula_width)
+            y = rng.randint(0, self.nebula_height)
+            radius = rng.randint(80, 200)
+            color = rng.choice(colors)
             self.nebula_particles.append((x, y, radius, color))
     
+    def _bake_chunk(self, layer_idx: int, chunk_x: int, chunk_y: int) -> pygame.Surface:
+        """Pre-render one chunk of a star layer into a palettized surface"""
+        chunk = pygame.Surface((self.CHUNK_SIZE, self.CHUNK_SIZE), 0, 8)
+        chunk.set_colorkey(0)
+        
+        for star in self._generate_chunk(layer_idx, chunk_x, chunk_y):
+            phase = round(star.twinkle_offset / (math.pi * 2) * self.TWINKLE_PHASES) % self.TWINKLE_PHASES
+            level = round(star.brightness * (self.BRIGHTNESS_LEVELS - 1) / 255)
+            index = 1 + phase * self.BRIGHTNESS_LEVELS + level
+            
+            if star.size > 1:
+                # Draw larger stars as circles
+                pygame.draw.circle(chunk, index, (star.x, star.y), int(star.size))
+            else:
+                # Draw small stars as single pixels
+                chunk.set_at((star.x, star.y), index)
+        
+        return chunk
+    
+    def _get_chunk(self, layer_idx: int, chunk_x: int, chunk_y: int) -> pygame.Surface:
+        """Get a pre-rendered chunk, baking it and evicting old chunks as needed"""
+        key = (layer_idx, chunk_x, chunk_y)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            return chunk
+        
+        chunk = self._bake_chunk(layer_idx, chunk_x, chunk_y)
+        self.chunks[key] = chunk
+        self.chunk_bytes += self.CHUNK_SIZE * self.CHUNK_SIZE
+        
+        while self.chunk_bytes > self.CHUNK_CACHE_BYTES and len(self.chunks) > 1:
+            self.chunks.popitem(last=False)
+            self.chunk_bytes -= self.CHUNK_SIZE * self.CHUNK_SIZE
+        
+        return chunk
+    
+    def _bake_nebula(self) -> pygame.Surface:
+        """Pre-render the nebula field into an opaque, seamlessly tiling background"""
+        scale = self.NEBULA_BAKE_SCALE
+        width = round(self.nebula_width * scale)
+        height = round(self.nebula_height * scale)
+        nebula_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        for x, y, radius, color in self.nebula_particles:
+            # Repeat each nebula across the wrap edges
+            for offset_x in (-self.nebula_width, 0, self.nebula_width):
+                for offset_y in (-self.nebula_height, 0, self.nebula_height):
+                    center = (int((x + offset_x) * scale), int((y + offset_y) * scale))
+                    
+                    # Create radial gradient effect
+                    steps = 5
+                    for i in range(steps):
+                        r = radius * scale * (1 - i / steps)
+                        alpha = int(color[3] * (1 - i / steps))
+                        current_color = (color[0], color[1], color[2], alpha)
+                        pygame.draw.circle(nebula_surface, current_color, center, int(r))
+        
+        # Composite over the black background once
+        background = pygame.Surface((width, height))
+        background.fill(BLACK)
+        background.blit(nebula_surface, (0, 0))
+        
+        if (width, height) != (self.nebula_width, self.nebula_height):
+            background = pygame.transform.smoothscale(background, (self.nebula_width, self.nebula_height))
+        if pygame.display.get_surface():
+            background = background.convert()
+        return background
+    
+    def _blit_wrapped(self, screen: pygame.Surface, tile: pygame.Surface, offset_x: int, offset_y: int):
+        """Blit a tile repeatedly so it covers the screen, shifted by an offset"""
+        tile_width, tile_height = tile.get_size()
+        x = -(offset_x % tile_width)
+        while x < SCREEN_WIDTH:
+            y = -(offset_y % tile_height)
+            while y < SCREEN_HEIGHT:
+                screen.blit(tile, (x, y))
+                y += tile_height
+            x += tile_width
+    
+    def _twinkle_palette(self, time: float) -> List[Tuple[int, int, int]]:
+        """Build the palette mapping (phase, brightness level) to a colour at a given time"""
+        phases = np.arange(self.TWINKLE_PHASES) * (math.pi * 2 / self.TWINKLE_PHASES)
+        twinkle = np.sin(time * self.TWINKLE_SPEED + phases) * self.TWINKLE_AMPLITUDE + self.TWINKLE_BASE
+        levels = np.arange(self.BRIGHTNESS_LEVELS) * (255 / (self.BRIGHTNESS_LEVELS - 1))
+        brightness = np.clip(np.outer(twinkle, levels), 0, 255).astype(np.uint8).ravel()
+        
+        palette = np.zeros((256, 3), dtype=np.uint8)
+        palette[1:1 + len(brightness)] = brightness[:, None]
+        return [tuple(color) for color in palette.tolist()]
+    
     def render(self, screen: pygame.Surface, camera_x: float, camera_y: float, time: float):
         """Render the starfield with parallax scrolling"""
         # Render nebula first (background)
         self._render_nebula(screen, camera_x, camera_y)
         
-        # Render star layers with parallax
-        for layer_idx, layer in enumerate(self.layers):
-            _, _, size_range, _, parallax_factor = self.layer_configs[layer_idx]
+        # Animate twinkling for every layer with one palette
+        palette = self._twinkle_palette(time)
+        
+        # Blit the visible chunks of each layer at its parallax offset
+        size = self.CHUNK_SIZE
+        for layer_idx, config in enumerate(self.layer_configs):
+            parallax_factor = config[4]
+            offset_x = math.ceil(camera_x * parallax_factor)
+            offset_y = math.ceil(camera_y * parallax_factor)
             
-            for star in layer:
-                # Apply parallax based on depth
-                parallax_x = camera_x * parallax_factor
-                parallax_y = camera_y * parallax_factor
-                
-                # Calculate screen position with wrapping
-                world_width = SCREEN_WIDTH * 3
-                world_height = SCREEN_HEIGHT * 3
-                
-                screen_x = (star.x - parallax_x) % world_width
-                screen_y = (star.y - parallax_y) % world_height
-                
-                # Only draw if on screen (with margin)
-                if -50 < screen_x < SCREEN_WIDTH + 50 and -50 < screen_y < SCREEN_HEIGHT + 50:
-                    # Add subtle twinkling effect
-                    twinkle = math.sin(time * self.TWINKLE_SPEED + star.twinkle_offset) * self.TWINKLE_AMPLITUDE + self.TWINKLE_BASE
-                    brightness = int(star.brightness * twinkle)
-                    brightness = max(0, min(255, brightness))
-                    
-                    color = (brightness, brightness, brightness)
-                    
-                    if star.size > 1:
-                        # Draw larger stars as circles
-                        pygame.draw.circle(screen, color, (int(screen_x), int(screen_y)), int(star.size))
-                    else:
-                        # Draw small stars as single pixels
-                        if 0 <= screen_x < SCREEN_WIDTH and 0 <= screen_y < SCREEN_HEIGHT:
-                            screen.set_at((int(screen_x), int(screen_y)), color)
+            for chunk_x in range(offset_x // size, (offset_x + SCREEN_WIDTH - 1) // size + 1):
+                for chunk_y in range(offset_y // size, (offset_y + SCREEN_HEIGHT - 1) // size + 1):
+                    chunk = self._get_chunk(layer_idx, chunk_x, chunk_y)
+                    chunk.set_palette(palette)
+                    screen.blit(chunk, (chunk_x * size - offset_x, chunk_y * size - offset_y))
     
     def _render_nebula(self, screen: pygame.Surface, camera_x: float, camera_y: float):
-        """Render nebula clouds in the background"""
-        # Create a temporary surface for nebula with alpha
-        nebula_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        
-        for x, y, radius, color in self.nebula_particles:
-            # Very slow parallax for nebula (0.1x camera movement)
-            parallax_x = camera_x * 0.1
-            parallax_y = camera_y * 0.1
-            
-            world_width = SCREEN_WIDTH * 4
-            world_height = SCREEN_HEIGHT * 4
-            
-            screen_x = (x - parallax_x) % world_width
-            screen_y = (y - parallax_y) % world_height
-            
-            # Draw nebula as soft gradients
-            if -radius < screen_x < SCREEN_WIDTH + radius and -radius < screen_y < SCREEN_HEIGHT + radius:
-                # Create radial gradient effect
-                steps = 5
-                for i in range(steps):
-                    r = radius * (1 - i / steps)
-                    alpha = int(color[3] * (1 - i / steps))
-                    current_color = (color[0], color[1], color[2], alpha)
-                    pygame.draw.circle(nebula_surface, current_color, (int(screen_x), int(screen_y)), int(r))
-        
-        # Blit nebula surface onto main screen
-        screen.blit(nebula_surface, (0, 0))
+        """Render nebula clouds in the background (covers the whole screen)"""
+        # Very slow parallax for nebula
+        self._blit_wrapped(screen, self.nebula_tile,
+                           math.ceil(camera_x * self.NEBULA_PARALLAX),
+                           math.ceil(camera_y * self.NEBULA_PARALLAX))
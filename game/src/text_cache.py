@@ -0,0 +1,44 @@
+"""Caching of rendered text for the HUD"""
+import pygame
+from collections import OrderedDict
+from typing import List, Tuple
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (font, text, colour)"""
+    
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.surfaces: "OrderedDict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def render(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Get antialiased text, rendering it only if it is not cached"""
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+    
+    def clear(self):
+        """Drop all cached text"""
+        self.surfaces.clear()
+
+def render_panel(cache: TextCache,
+                 lines: List[Tuple[pygame.font.Font, str, Tuple[int, int, int], int, int]]) -> pygame.Surface:
+    """Compose (font, text, colour, x, y) lines into one transparent surface"""
+    surfaces = [(cache.render(font, text, color), x, y) for font, text, color, x, y in lines]
+    width = max((x + s.get_width() for s, x, _ in surfaces), default=1)
+    height = max((y + s.get_height() for s, _, y in surfaces), default=1)
+    panel = pygame.Surface((width, height), pygame.SRCALPHA)
+    for surface, x, y in surfaces:
+        panel.blit(surface, (x, y))
+    return panel